@@ -2,11 +2,9 @@
 ### and save in some useful format.                                ###
 
 # Imports
-from smact.screening import smact_test
+from smact.screening import screen_space
 from smact import Element, element_dictionary
-import itertools
 import multiprocessing
-from functools import partial
 from pymatgen import Composition
 from datetime import datetime
 import pickle
@@ -30,6 +28,10 @@ always_include = ['O']
 # Set stoichiometry threshold
 threshold = 4
 
+# Set of oxidation states to use: 'default' (most exhaustive), 'icsd',
+# 'sp' or 'pmg'. Smaller sets such as 'icsd' run considerably faster.
+oxidation_states_set = 'default'
+
 # Set order of combinations, e.g 2 for binaries, 3 for ternaries.
 # MIND: If you are using always_include, order = elements per composition - 1
 # e.g. to explore ternary oxides, order = 2.
@@ -44,12 +46,7 @@ pretty_formulas_export = True
 ### === You don't need to edit anything below here === ###
 
 elements = [all_el[x] for x in symbols]
-if always_include:
-    include = [all_el[x] for x in always_include]
-
-# Multiprocessing-friendly function
-def MapFunction(els):
-    return smact_test(els, threshold = threshold, include = include)
+include = [all_el[x] for x in always_include] if always_include else None
 
 # Function to convert into pretty formulas if desired
 def comp_maker(comp):
@@ -62,30 +59,25 @@ def comp_maker(comp):
     return pmg_form
 
 if __name__ == "__main__":
-    # Set up iterator
-    all_combos = itertools.combinations(elements, order)
-
     print("Elements to consider: {0}".format(symbols))
     print("Elements to include in every composition: {0}".format(always_include))
 
-    # Do the smact tests using multiprocessing
+    # Do the smact tests on all combinations using multiprocessing
     print("Running SMACT tests...")
     start_time = datetime.now()
-    p = multiprocessing.Pool()
-    result = p.map(MapFunction, all_combos)
+    flat_list = list(screen_space(elements, order, threshold=threshold,
+                                  include=include,
+                                  oxidation_states_set=oxidation_states_set))
     print("Time to complete SMACT tests: {0}".format(datetime.now() - start_time))
 
-    # Tidy output into one list and do pickling
-    print("Tidying everything into one list...")
-    flat_list = [item for sublist in result for item in sublist]
-
     print("Pickling list of compositions to {0}_compositions.pkl...".format(filekey))
     with open('{0}_compositions.pkl'.format(filekey), 'wb') as f:
         pickle.dump(flat_list, f)
 
     if pretty_formulas_export:
         print("Converting to a list of unique pretty formulas... ")
-        pretty_formulas = p.map(comp_maker, flat_list)
+        with multiprocessing.Pool() as p:
+            pretty_formulas = p.map(comp_maker, flat_list)
         pretty_formulas = list(set(pretty_formulas))
         print("Pickling list of pretty formulas to {0}_prettyform.pkl...".format(filekey))
         with open('{0}prettyform.pkl'.format(filekey), 'wb') as f:
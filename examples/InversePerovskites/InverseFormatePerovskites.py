@@ -5,27 +5,17 @@
 
 #get_ipython().magic(u'matplotlib inline')
 import smact
+from smact import data_loader
 import smact.lattice as lattice
 import smact.builder as builder
 import smact.screening as screening
 import copy
 import os
-import csv
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 
 
-# In[2]:
-
-# get correct path for datafiles when called from another directory
-smact_directory = '../../smact'
-# Append a trailing slash to make coherent directory name - this would select the
-# root directory in the case of no prefix, so we need to check
-if smact_directory:
-    smact_directory = smact_directory + '/'
-
-
 # In[3]:
 
 site_A = lattice.Site([0,0,0],[-1])
@@ -41,19 +31,14 @@ search = smact.ordered_elements(3,87)
 
 # In[5]:
 
-A_list = []
-B_list = []
+# Restrict the A site to 12-fold coordination with coordinations=['12_n']
+A_radii = data_loader.lookup_shannon_radii_many(
+    elements=search, charges=site_A.oxidation_states)
+B_radii = data_loader.lookup_shannon_radii_many(
+    elements=search, charges=site_B.oxidation_states, coordinations=['6_n'])
+A_list = [[row['symbol'], int(row['charge']), float(row['ionic_radius'])] for row in A_radii]
+B_list = [[row['symbol'], int(row['charge']), float(row['ionic_radius'])] for row in B_radii]
 C_list = [['F',-1,4.47]]
-for element in search:
-    with open(smact_directory + 'data/shannon_radii.csv','rU') as f:
-        reader = csv.reader(f)
-        r_shannon=False
-        for row in reader:
-            #if row[2]=="12_n" and row[0]==element and int(row[1]) in site_A.oxidation_states:
-            if row[0]==element and int(row[1]) in site_A.oxidation_states:
-                A_list.append([row[0],row[1],row[4]])
-            if row[2]=="6_n" and row[0]==element and int(row[1]) in site_B.oxidation_states:
-                B_list.append([row[0],row[1],row[4]])
 
 
 
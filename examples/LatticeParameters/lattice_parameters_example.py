@@ -26,7 +26,7 @@ import smact
 import smact.lattice_parameters as lp
 import numpy as np
 import sys
-import csv
+from smact import data_loader
 
 def main():
     crystal_elements = input('Which elements? Separate chemical symbols with a space. ')
@@ -62,18 +62,11 @@ def main():
 
     i=0
     for elements in crystal_elements:
-        poss_ox = []
-        poss_cood = []
-        with open('data/shannon_radii.csv','rU') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if row[0] == elements:
-                    poss_ox.append(row[1])
-                    poss_cood.append(row[2])
+        shannon_data = data_loader.lookup_element_shannon_radius_data(elements) or ()
         poss_ox_clean = [] ### Duplicates removed
-        for ox in poss_ox:
-            if ox not in poss_ox_clean:
-                poss_ox_clean.append(ox)
+        for row in shannon_data:
+            if row.charge not in poss_ox_clean:
+                poss_ox_clean.append(row.charge)
         print(elements)
         print(poss_ox_clean)
         if len(poss_ox_clean) == 1:
@@ -81,15 +74,9 @@ def main():
         else:
             oxidation.append(int(input('Oxidation state of ' + elements + ' ')))
         poss_co_clean = [] ### Duplicates removed
-        with open('data/shannon_radii.csv','rU') as f:
-            reader = csv.reader(f)
-            poss_cood = []
-            for row in reader:
-                if row[0] == elements and int(row[1]) == int(oxidation[-1]):
-                    poss_cood.append(row[2])
-        for co in poss_cood:
-            if co not in poss_co_clean:
-                poss_co_clean.append(co)
+        for row in shannon_data:
+            if row.charge == oxidation[-1] and row.coordination not in poss_co_clean:
+                poss_co_clean.append(row.coordination)
         print(elements)
         print(poss_co_clean)
         if len(poss_co_clean) == 1:
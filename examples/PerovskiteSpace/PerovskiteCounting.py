@@ -19,8 +19,7 @@ import smact.lattice as lattice
 
 import matplotlib
 import smact
-from os import path
-import csv
+from smact import data_loader
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
@@ -59,18 +58,13 @@ initial_total = len(list(itertools.combinations(search, 3)))
 
 # In[5]:
 
-A_list = []
-B_list = []
+A_radii = data_loader.lookup_shannon_radii_many(
+    elements=search, charges=site_A.oxidation_states)
+B_radii = data_loader.lookup_shannon_radii_many(
+    elements=search, charges=site_B.oxidation_states, coordinations=['6_n'])
+A_list = [[row['symbol'], float(row['charge']), float(row['ionic_radius'])] for row in A_radii]
+B_list = [[row['symbol'], float(row['charge']), float(row['ionic_radius'])] for row in B_radii]
 C_list = [['O',-2,1.35],['S',-2,1.84],['Se',-2,1.98],['F',-1,1.29],['Cl',-1,1.81],['Br',-1,1.96],['I',-1,2.2]]
-for element in search:
-    with open(path.join(smact.data_directory, 'shannon_radii.csv'), 'rU') as f:
-        reader = csv.reader(f)
-        r_shannon=False
-        for row in reader:
-            if row[0]==element and int(row[1]) in site_A.oxidation_states:
-                A_list.append([row[0], float(row[1]), float(row[4])])
-            if row[2]=="6_n" and row[0]==element and int(row[1]) in site_B.oxidation_states:
-                B_list.append([row[0], float(row[1]), float(row[4])])
 
 
 # ## Iterative search
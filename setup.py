@@ -23,9 +23,10 @@ if __name__ == "__main__":
         author_email='d.w.davies@bath.ac.uk',
         license='GNU General Public License (GPL) v3',
         packages=['smact','smact.tests'],
-        package_data={'smact': ['data/*.txt','data/*.csv']},
+        package_data={'smact': ['data/*.txt','data/*.csv','data/*.json']},
         zip_safe=False,
-        install_requires=['scipy','numpy','spglib'],
+        python_requires='>=3.8',
+        install_requires=['scipy','numpy>=1.17','spglib'],
         classifiers=['Programming Language :: Python',
                      'Development Status :: 5 - Production/Stable',
                      'Intended Audience :: Science/Research',
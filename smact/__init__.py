@@ -19,21 +19,62 @@ A collection of fast screening tools from elemental data
 """
 
 # get correct path for datafiles when called from another directory
-from builtins import filter
-from builtins import map
-from builtins import range
-from builtins import object
 from os import path
 module_directory = path.abspath(path.dirname(__file__))
 data_directory = path.join(module_directory, 'data')
 import itertools
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
-
-from fractions import gcd
+from math import gcd
 from operator import mul as multiply
 
+# NumPy is imported inside the functions which use it, so that a plain
+# `import smact` stays fast.
+
 from smact import data_loader
 
+class _lazy_attribute(object):
+    """Descriptor which resolves an attribute from the data files on first use
+
+    The decorated method computes the value; it is stored in a slot named
+    after the attribute with a leading underscore, so later reads only cost
+    a slot lookup.
+    """
+    def __init__(self, loader):
+        self.loader = loader
+        self.__doc__ = loader.__doc__
+
+    def __set_name__(self, owner, name):
+        self.slot = owner.__dict__['_' + name]
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.loader(instance)
+            self.slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance, value):
+        raise AttributeError("{0} objects are immutable".format(
+            type(instance).__name__))
+
+class _lazy_list_attribute(_lazy_attribute):
+    """_lazy_attribute for list values, returning a new copy on every read
+
+    Element objects are shared, so a caller modifying the list it was
+    given must not change the value seen by everyone else.
+    """
+    def __get__(self, instance, owner):
+        value = super().__get__(instance, owner)
+        if instance is None or value is None:
+            return value
+        return list(value)
+
 class Element(object):
     """Collection of standard elemental properties for given element.
 
@@ -82,76 +123,143 @@ class Element(object):
 
         Element.HHI_r (float) : Hirfindahl-Hirschman Index for elemental reserves
 
+    Element objects are immutable and interned: constructing an Element
+    for a symbol that has already been loaded returns the cached instance.
+    Only the basic data from element_data.txt is read on construction;
+    oxidation states, coordination environments, HHI and SSE values are
+    resolved on first access.
+
     Raises:
         NameError: Element not found in element.txt
         Warning: Element not found in Eigenvalues.csv
 
     """
-    def __init__(self, symbol):
-        """Initialise Element class
+    __slots__ = ('covalent_radius', 'crustal_abundance', 'e_affinity', 'eig',
+                 'eig_s', 'ionpot', 'mass', 'name', 'number', 'pauling_eneg',
+                 'symbol',
+                 # Storage for the lazily-resolved attributes below
+                 '_coord_envs', '_HHI_p', '_HHI_r', '_oxidation_states',
+                 '_oxidation_states_icsd', '_oxidation_states_sp', '_SSE',
+                 '_SSEPauling')
+
+    # Interned instances, keyed by symbol
+    _instances = {}
+
+    def __new__(cls, symbol):
+        """Get the (cached) Element for a symbol
 
         Args:
             symbol (str): Chemical element symbol (e.g. 'Fe')
 
         """
+        try:
+            return cls._instances[symbol]
+        except KeyError:
+            pass
 
-        dataset = data_loader.lookup_element_data(symbol, copy=False)
+        self = object.__new__(cls)
+        self._load_element(symbol)
+        cls._instances[symbol] = self
+        return self
 
-        if dataset == None:
-            raise NameError("Elemental data for {0} not found.".format(symbol))
-
-        # Set coordination-environment data from the Shannon-radius data.
-        # As above, it is safe to use copy = False with this Get* function.
+    def _load_element(self, symbol):
+        """Set the basic elemental attributes from element_data.txt"""
 
-        shannon_data = data_loader.lookup_element_shannon_radius_data(symbol, copy=False)
+        dataset = data_loader.lookup_element_data(symbol)
 
-        if shannon_data != None:
-            coord_envs = [row['coordination'] for row in shannon_data]
-        else:
-            coord_envs = None
-
-        HHI_scores = data_loader.lookup_element_hhis(symbol)
-        if HHI_scores == None:
-            HHI_scores = (None, None)
-
-        sse_data = data_loader.lookup_element_sse_data(symbol)
-        if sse_data:
-            sse = sse_data['SolidStateEnergy']
-        else:
-            sse = None
-
-        sse_Pauling_data = data_loader.lookup_element_sse_pauling_data(symbol)
-        if sse_Pauling_data:
-            sse_Pauling = sse_Pauling_data['SolidStateEnergyPauling']
-        else:
-            sse_Pauling = None
+        if dataset == None:
+            raise NameError("Elemental data for {0} not found.".format(symbol))
 
         for attribute, value in (
-            ('coord_envs', coord_envs),
             ('covalent_radius', dataset['r_cov']),
             ('crustal_abundance', dataset['Abundance']),
             ('e_affinity', dataset['e_affinity']),
             ('eig', dataset['p_eig']),
             ('eig_s', dataset['s_eig']),
-            ('HHI_p', HHI_scores[0]),
-            ('HHI_r', HHI_scores[1]),
             ('ionpot', dataset['ion_pot']),
             ('mass', dataset['Mass']),
             ('name', dataset['Name']),
             ('number', dataset['Z']),
-            ('oxidation_states',
-             data_loader.lookup_element_oxidation_states(symbol)),
-            ('oxidation_states_icsd',
-             data_loader.lookup_element_oxidation_states_icsd(symbol)),
-            ('oxidation_states_sp',
-             data_loader.lookup_element_oxidation_states_sp(symbol)),
             ('pauling_eneg', dataset['el_neg']),
-            ('SSE', sse),
-            ('SSEPauling', sse_Pauling),
             ('symbol', symbol),
             #('vdw_radius', dataset['RVdW']),
             ):
-            setattr(self, attribute, value)
+            object.__setattr__(self, attribute, value)
+
+    @_lazy_list_attribute
+    def coord_envs(self):
+        """Coordination environments from the Shannon-radius data"""
+        shannon_data = data_loader.lookup_element_shannon_radius_data(
+            self.symbol)
+
+        if shannon_data != None:
+            return [row['coordination'] for row in shannon_data]
+        else:
+            return None
+
+    @_lazy_attribute
+    def HHI_p(self):
+        """Herfindahl-Hirschman Index for elemental production"""
+        HHI_scores = data_loader.lookup_element_hhis(self.symbol)
+        return HHI_scores[0] if HHI_scores != None else None
+
+    @_lazy_attribute
+    def HHI_r(self):
+        """Herfindahl-Hirschman Index for elemental reserves"""
+        HHI_scores = data_loader.lookup_element_hhis(self.symbol)
+        return HHI_scores[1] if HHI_scores != None else None
+
+    @_lazy_list_attribute
+    def oxidation_states(self):
+        """Default list of allowed oxidation states"""
+        states = data_loader.lookup_element_oxidation_states(self.symbol)
+        return list(states) if states is not None else None
+
+    @_lazy_list_attribute
+    def oxidation_states_icsd(self):
+        """List of oxidation states that appear in the ICSD"""
+        states = data_loader.lookup_element_oxidation_states_icsd(self.symbol)
+        return list(states) if states is not None else None
+
+    @_lazy_list_attribute
+    def oxidation_states_sp(self):
+        """List of oxidation states recognised by the Pymatgen Structure Predictor"""
+        states = data_loader.lookup_element_oxidation_states_sp(self.symbol)
+        return list(states) if states is not None else None
+
+    @_lazy_attribute
+    def SSE(self):
+        """Solid State Energy"""
+        sse_data = data_loader.lookup_element_sse_data(self.symbol)
+        if sse_data:
+            return sse_data['SolidStateEnergy']
+        else:
+            return None
+
+    @_lazy_attribute
+    def SSEPauling(self):
+        """SSE based on regression fit with Pauling electronegativity"""
+        sse_Pauling_data = data_loader.lookup_element_sse_pauling_data(
+            self.symbol)
+        if sse_Pauling_data:
+            return sse_Pauling_data['SolidStateEnergyPauling']
+        else:
+            return None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{0} objects are immutable".format(
+            type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{0} objects are immutable".format(
+            type(self).__name__))
+
+    def __reduce__(self):
+        # Unpickling goes through the constructor, so the result is interned
+        return (type(self), (self.symbol,))
+
+    def __repr__(self):
+        return "Element({0!r})".format(self.symbol)
 
 class Species(Element):
     """
@@ -162,6 +270,10 @@ class Species(Element):
     oxidation state and coordination environment to provide further
     properties.
 
+    Like Element objects, Species objects are immutable and interned by
+    (symbol, oxidation, coordination), and the Shannon radius and SSE_2015
+    are resolved on first access.
+
     Attributes:
         Species.symbol: Elemental symbol used to retrieve data
 
@@ -185,33 +297,94 @@ class Species(Element):
         Warning: Element not found in Eigenvalues.csv
 
     """
+    __slots__ = ('oxidation', 'coordination', '_shannon_radius', '_SSE_2015')
+
+    # Interned instances, keyed by (symbol, oxidation, coordination)
+    _instances = {}
+
+    def __new__(cls, symbol, oxidation, coordination=4):
+        key = (symbol, oxidation, coordination)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+
+        self = object.__new__(cls)
+        self._load_element(symbol)
+        object.__setattr__(self, 'oxidation', oxidation)
+        object.__setattr__(self, 'coordination', coordination)
+        cls._instances[key] = self
+        return self
 
-    def __init__(self,symbol,oxidation,coordination=4):
-        Element.__init__(self,symbol)
+    @_lazy_attribute
+    def shannon_radius(self):
+        """Shannon crystal radius for the oxidation state and coordination"""
+        dataset = data_loader.lookup_species_shannon_radius_data(
+            self.symbol, self.oxidation, self.coordination)
+        return dataset['crystal_radius'] if dataset != None else None
 
-        self.oxidation = oxidation
-        self.coordination = coordination
+    @_lazy_attribute
+    def SSE_2015(self):
+        """SSE_2015 (revised) for the oxidation state"""
+        return data_loader.lookup_species_sse2015(self.symbol, self.oxidation)
 
-        # Get shannon radius for the oxidation state and coordination.
+    def __reduce__(self):
+        return (type(self), (self.symbol, self.oxidation, self.coordination))
 
-        self.shannon_radius = None;
+    def __repr__(self):
+        return "Species({0!r}, {1!r}, {2!r})".format(
+            self.symbol, self.oxidation, self.coordination)
 
-        shannon_data = data_loader.lookup_element_shannon_radius_data(symbol);
 
-        for dataset in shannon_data:
-            if dataset['charge'] == oxidation and dataset['coordination'] == coordination:
-                self.shannon_radius = dataset['crystal_radius'];
+def _discard_changed_instances(event):
+    """Event hook dropping interned objects of elements whose data changed"""
 
-        # Get SSE_2015 (revised) for the oxidation state.
+    if event['event'] != 'data_changed':
+        return
+    store = data_loader.get_default_store()
+    if event.get('store', store) is not store:
+        return
 
-        self.SSE_2015 = None
+    symbols = event['symbols']
+    for cls in (Element, Species):
+        for key, instance in list(cls._instances.items()):
+            if symbols is None or instance.symbol in symbols:
+                cls._instances.pop(key, None)
 
-        sse_2015_data = data_loader.lookup_element_sse2015_data(symbol);
+data_loader.add_event_hook(_discard_changed_instances)
 
-        for dataset in sse_2015_data:
-            if dataset['OxidationState'] == oxidation:
-                self.SSE_2015 = dataset['SolidStateEnergy2015']
 
+def species_table(species):
+    """
+    Get Shannon radii and SSE_2015 values for many species at once
+
+    Useful for building screens (e.g. perovskites or lattice parameters)
+    over every ion without constructing Species objects.
+
+    Args:
+        species (iterable of tuples) : (symbol, oxidation, coordination)
+            for each species, e.g. ('Fe', 3, '6_n'). Coordination may be
+            omitted, in which case it defaults to 4 as for
+            :class:`smact.Species`.
+
+    Returns:
+        (shannon_radius, SSE_2015) (tuple): float arrays with one entry per
+            species, NaN where no data is available
+    """
+    import numpy as np
+    radii, sse_2015 = [], []
+    for entry in species:
+        symbol, oxidation = entry[0], entry[1]
+        coordination = entry[2] if len(entry) > 2 else 4
+
+        dataset = data_loader.lookup_species_shannon_radius_data(
+            symbol, oxidation, coordination)
+        radii.append(dataset['crystal_radius'] if dataset != None else np.nan)
+
+        sse = data_loader.lookup_species_sse2015(symbol, oxidation)
+        sse_2015.append(sse if sse != None else np.nan)
+
+    return (np.array(radii, dtype=float), np.array(sse_2015, dtype=float))
 
 def ordered_elements(x,y):
     """
@@ -221,19 +394,7 @@ def ordered_elements(x,y):
     Returns:
         list: Ordered list of element symbols
     """
-    with open(path.join(data_directory,
-                        'ordered_periodic.txt'), 'r') as f:
-        data = f.readlines()
-    elements = []
-    for line in data:
-        inp = line.split()
-        elements.append(inp[0])
-
-    ordered_elements = []
-    for i in range(x,y+1):
-        ordered_elements.append(elements[i-1])
-
-    return ordered_elements
+    return list(data_loader.lookup_ordered_symbols()[x-1:y])
 
 def element_dictionary(elements=None):
     """
@@ -254,6 +415,89 @@ def element_dictionary(elements=None):
     return {symbol: Element(symbol) for symbol in elements}
 
 
+class ElementTable(object):
+    """Array-backed table of elemental properties, indexed by proton number.
+
+    Each property is held in a single NumPy array of length 104, so that
+    ``table.pauling_eneg[z]`` is the electronegativity of the element with
+    proton number z (index 0 is unused). Missing values are stored as NaN.
+    Properties for a whole combination of elements can be gathered with one
+    fancy-index operation, e.g.
+    ``table.pauling_eneg[table.numbers(['Cu', 'Zn', 'S'])]``.
+
+    The default oxidation states are stored in compressed sparse row (CSR)
+    form: the states of element z are
+    ``oxidation_state_values[oxidation_state_offsets[z]:oxidation_state_offsets[z + 1]]``.
+
+    Attributes:
+        ElementTable.symbols (numpy.ndarray) : Element symbol for each Z
+            (None at index 0)
+
+        ElementTable.z (dict) : Proton number keyed by element symbol
+
+        ElementTable.pauling_eneg, ElementTable.ionpot,
+        ElementTable.e_affinity, ElementTable.eig, ElementTable.eig_s,
+        ElementTable.SSE, ElementTable.SSEPauling, ElementTable.HHI_p,
+        ElementTable.HHI_r, ElementTable.mass,
+        ElementTable.covalent_radius, ElementTable.crustal_abundance
+            (numpy.ndarray) : float arrays of the corresponding
+            :class:`smact.Element` attributes
+
+        ElementTable.oxidation_state_offsets (numpy.ndarray) : CSR offsets
+            into oxidation_state_values, length 105
+
+        ElementTable.oxidation_state_values (numpy.ndarray) : Concatenated
+            default oxidation states of all elements
+    """
+
+    n_elements = 103
+
+    _properties = ('covalent_radius', 'crustal_abundance', 'e_affinity',
+                   'eig', 'eig_s', 'ionpot', 'mass', 'pauling_eneg',
+                   'SSE', 'SSEPauling', 'HHI_p', 'HHI_r')
+
+    def __init__(self):
+        import numpy as np
+        size = self.n_elements + 1
+        self.symbols = np.empty(size, dtype=object)
+        self.symbols[1:] = ordered_elements(1, self.n_elements)
+        self.z = {symbol: z for z, symbol in enumerate(self.symbols) if z}
+
+        # Proton number 0 is out of range, so row 0 comes back empty
+        for attribute in self._properties:
+            setattr(self, attribute,
+                    data_loader.lookup_many(attribute, np.arange(size)))
+
+        (self.oxidation_state_offsets,
+         self.oxidation_state_values) = \
+            data_loader.lookup_oxidation_states_many(np.arange(size))
+
+    def numbers(self, symbols):
+        """Get the proton numbers of a sequence of element symbols
+
+        Args:
+            symbols (iterable of str) : Element symbols
+
+        Returns:
+            numpy.ndarray: Integer array of proton numbers
+        """
+        import numpy as np
+        return np.array([self.z[symbol] for symbol in symbols],
+                        dtype=np.int64)
+
+    def oxidation_states(self, z):
+        """Get the default oxidation states of an element
+
+        Args:
+            z (int) : Proton number
+
+        Returns:
+            numpy.ndarray: Oxidation states of the element
+        """
+        return self.oxidation_state_values[
+            self.oxidation_state_offsets[z]:self.oxidation_state_offsets[z + 1]]
+
+
 def are_eq(A,B,tolerance=1e-4):
     """Check two arrays for tolerance [1,2,3]==[1,2,3]; but [1,3,2]!=[1,2,3]
     Args:
@@ -345,7 +589,223 @@ def neutral_ratios_iter(oxidations, stoichs=False, threshold=5):
         itertools.product(*stoichs)
         )
 
-def neutral_ratios(oxidations, stoichs=False, threshold=5):
+def _stoich_grid(stoichs):
+    """
+    Enumerate every combination of per-site stoichiometries as an array
+
+    Rows follow the same order as ``itertools.product(*stoichs)``.
+
+    Args:
+        stoichs (list of lists of ints): Allowed coefficients for each site
+
+    Returns:
+        numpy.ndarray: 2-D integer array with one row per combination and
+            one column per site
+    """
+    import numpy as np
+    stoichs = [np.asarray(site, dtype=np.int64) for site in stoichs]
+    indices = np.indices([len(site) for site in stoichs]).reshape(
+        len(stoichs), -1)
+    return np.column_stack([site[index]
+                            for site, index in zip(stoichs, indices)])
+
+# Irreducible stoichiometry grids keyed by (n_sites, threshold), least
+# recently used first. Grids are evicted once together they take more than
+# _IRREDUCIBLE_RATIOS_MAX_BYTES, and a grid larger than that is never kept.
+
+_IRREDUCIBLE_RATIOS_MAX_BYTES = 64 * 2**20
+_irreducible_ratios_cache = OrderedDict()
+_irreducible_ratios_lock = threading.Lock()
+
+def _irreducible_ratios(n_sites, threshold):
+    """
+    Get all irreducible stoichiometries for a number of sites
+
+    The set of ratios in simplest form (gcd of 1) depends only on the number
+    of sites and the threshold, so it is computed once per (n_sites,
+    threshold) pair and kept in a least-recently-used cache bounded by
+    the memory its grids take.
+
+    Args:
+        n_sites (int): Number of sites
+        threshold (int): Maximum stoichiometry coefficient
+
+    Returns:
+        numpy.ndarray: Read-only 2-D integer array of ratios, in the same
+            order as ``itertools.product``
+    """
+    import numpy as np
+    key = (n_sites, threshold)
+    with _irreducible_ratios_lock:
+        grid = _irreducible_ratios_cache.get(key)
+        if grid is not None:
+            _irreducible_ratios_cache.move_to_end(key)
+            return grid
+
+    grid = _stoich_grid([range(1, threshold + 1)] * n_sites)
+    grid = grid[np.gcd.reduce(grid, axis=1) == 1]
+    grid.setflags(write=False)
+    if grid.nbytes > _IRREDUCIBLE_RATIOS_MAX_BYTES:
+        return grid
+
+    with _irreducible_ratios_lock:
+        # Another thread may have computed the same grid meanwhile
+        grid = _irreducible_ratios_cache.setdefault(key, grid)
+        _irreducible_ratios_cache.move_to_end(key)
+        total = sum(cached.nbytes
+                    for cached in _irreducible_ratios_cache.values())
+        while total > _IRREDUCIBLE_RATIOS_MAX_BYTES:
+            _, evicted = _irreducible_ratios_cache.popitem(last=False)
+            total -= evicted.nbytes
+    return grid
+
+def _integer_states(oxidations):
+    """Oxidation states as an integer array, or None if any is fractional"""
+    import numpy as np
+    states = np.asarray(oxidations, dtype=np.float64)
+    integers = np.rint(states).astype(np.int64)
+    return integers if (integers == states).all() else None
+
+def _require_integer_states(oxidations):
+    """Oxidation states as an integer array, rejecting fractional states"""
+    integers = _integer_states(oxidations)
+    if integers is None:
+        raise ValueError("Non-integer oxidation states {0}; use "
+                         "neutral_ratios_iter".format(list(oxidations)))
+    return integers
+
+def neutral_ratios_array(oxidations, stoichs=False, threshold=5):
+    """
+    Get charge-neutral stoichiometries as a 2-D array
+
+    NumPy counterpart of :func:`neutral_ratios_iter`. The stoichiometry grid
+    is built as one integer array, the charge check is a single
+    matrix-vector product and the irreducibility check is a vectorized gcd
+    reduction over the rows which survive the charge check. Without
+    'stoichs' the gcd-filtered grid is taken from a process-wide cache keyed
+    by (number of sites, threshold), so only the charge check is repeated.
+
+    Args:
+        oxidations (list of ints): Oxidation state of each site
+        stoichs (list of positive ints): A selection of valid stoichiometric
+            ratios for each site
+        threshold (int): Maximum stoichiometry coefficient; if no 'stoichs'
+            argument is provided, all combinations of integer coefficients up
+            to this value will be tried.
+
+    Returns:
+        numpy.ndarray: Charge-neutral ratios, one per row, in the same order
+            as they are yielded by :func:`neutral_ratios_iter`
+
+    Raises:
+        ValueError: If any oxidation state is not an integer.
+    """
+    import numpy as np
+    oxidations = _require_integer_states(oxidations)
+    if not stoichs:
+        grid = _irreducible_ratios(len(oxidations), threshold)
+        return grid[grid.dot(oxidations) == 0]
+
+    grid = _stoich_grid(stoichs)
+    grid = grid[grid.dot(oxidations) == 0]
+    return grid[np.gcd.reduce(grid, axis=1) == 1]
+
+def neutral_ratios_mitm(oxidations, stoichs=False, threshold=5):
+    """
+    Get charge-neutral stoichiometries by a meet-in-the-middle search
+
+    Charge balance is a bounded linear Diophantine equation, so the sites
+    are split into two halves and the partial charge sums of each half are
+    enumerated separately. Pairs of partial sums which cancel are matched
+    with a sorted search, so only about threshold^(n/2) candidates are
+    generated per half and only genuinely neutral stoichiometries are ever
+    built. This is much faster than :func:`neutral_ratios_array` for five
+    or more sites, for which :func:`neutral_ratios` uses it by default.
+
+    Args:
+        oxidations (list of ints): Oxidation state of each site
+        stoichs (list of positive ints): A selection of valid stoichiometric
+            ratios for each site
+        threshold (int): Maximum stoichiometry coefficient; if no 'stoichs'
+            argument is provided, all combinations of integer coefficients up
+            to this value will be tried.
+
+    Returns:
+        numpy.ndarray: Charge-neutral ratios, one per row, identical (and in
+            the same order) to those of :func:`neutral_ratios_array`
+
+    Raises:
+        ValueError: If any oxidation state is not an integer.
+    """
+    import numpy as np
+    if len(oxidations) < 2:
+        return neutral_ratios_array(oxidations, stoichs=stoichs,
+                                    threshold=threshold)
+    if not stoichs:
+        stoichs = [list(range(1, threshold + 1))] * len(oxidations)
+    oxidations = _require_integer_states(oxidations)
+
+    split = len(oxidations) // 2
+    left, right = _stoich_grid(stoichs[:split]), _stoich_grid(stoichs[split:])
+    left_charge = left.dot(oxidations[:split])
+    right_charge = right.dot(oxidations[split:])
+
+    # A stable sort keeps right-hand rows with equal charge in their original
+    # order, so the matches come out in itertools.product order.
+    order = np.argsort(right_charge, kind='stable')
+    right_charge = right_charge[order]
+    start = np.searchsorted(right_charge, -left_charge, side='left')
+    counts = np.searchsorted(right_charge, -left_charge, side='right') - start
+
+    left_rows = np.repeat(np.arange(len(left)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                  counts)
+    right_rows = order[np.repeat(start, counts) + offsets]
+
+    grid = np.hstack((left[left_rows], right[right_rows]))
+    return grid[np.gcd.reduce(grid, axis=1) == 1]
+
+@lru_cache(maxsize=4096)
+def _sorted_neutral_ratios(oxidations, threshold, method):
+    """Memoized neutral ratios for oxidation states given in sorted order"""
+    search = neutral_ratios_array if method == 'numpy' else neutral_ratios_mitm
+    ratios = search(oxidations, threshold=threshold)
+    ratios.setflags(write=False)
+    return ratios
+
+def _memo_neutral_ratios(oxidations, threshold, method):
+    """
+    Look up neutral ratios in a memo keyed on the sorted oxidation states
+
+    Oxidation-state tuples which differ only in order share one cache entry;
+    the cached ratios are permuted back to the caller's site order and the
+    rows re-sorted so the result is identical to an uncached search.
+    """
+    import numpy as np
+    oxidations = _require_integer_states(oxidations)
+    order = np.argsort(oxidations, kind='stable')
+    ratios = _sorted_neutral_ratios(tuple(oxidations[order].tolist()),
+                                    threshold, method)
+    if (order == np.arange(len(order))).all():
+        return ratios.copy()
+    ratios = ratios[:, np.argsort(order)]
+    return ratios[np.lexsort(ratios.T[::-1])]
+
+def neutral_ratios_cache_info():
+    """
+    Get hit/miss statistics for the neutral_ratios memo
+
+    Returns:
+        functools CacheInfo: named tuple of (hits, misses, maxsize, currsize)
+    """
+    return _sorted_neutral_ratios.cache_info()
+
+def neutral_ratios_cache_clear():
+    """Empty the neutral_ratios memo and reset its statistics"""
+    _sorted_neutral_ratios.cache_clear()
+
+def neutral_ratios(oxidations, stoichs=False, threshold=5, method='auto',
+                   as_array=False, memoize=True):
     """
     Get a list of charge-neutral compounds
 
@@ -365,6 +825,20 @@ def neutral_ratios(oxidations, stoichs=False, threshold=5):
         threshold (int): Maximum stoichiometry coefficient; if no 'stoichs'
             argument is provided, all combinations of integer coefficients up
             to this value will be tried.
+        method (str): Search backend; 'numpy' uses
+            :func:`neutral_ratios_array`, 'mitm' uses
+            :func:`neutral_ratios_mitm` and 'python' uses
+            :func:`neutral_ratios_iter`. 'auto' (default) picks 'mitm' for
+            five or more sites and 'numpy' otherwise. All give identical
+            results; non-integer oxidation states are always searched with
+            'python'.
+        as_array (bool): If True, return the allowed ratios as a 2-D NumPy
+            array with one row per ratio instead of a list of tuples.
+        memoize (bool): If True (default) and no 'stoichs' are given, the
+            'numpy' and 'mitm' searches are memoized on the sorted oxidation
+            states, threshold and method, so permutations of the same states
+            share one least-recently-used cache entry. See
+            :func:`neutral_ratios_cache_info`.
 
     Returns:
         (exists, allowed_ratios) (tuple):
@@ -376,9 +850,33 @@ def neutral_ratios(oxidations, stoichs=False, threshold=5):
             Ratios of atoms in given oxidation
             states which yield a charge-neutral structure
     """
-    allowed_ratios = [x for x in neutral_ratios_iter(oxidations,
-                                                        stoichs=stoichs,
-                                                        threshold=threshold)]
+    import numpy as np
+    if method == 'auto':
+        method = 'mitm' if len(oxidations) >= 5 else 'numpy'
+    if method in ('numpy', 'mitm') and _integer_states(oxidations) is None:
+        # Fractional (e.g. mean) oxidation states need the exact search
+        method = 'python'
+
+    if method in ('numpy', 'mitm'):
+        if memoize and not stoichs:
+            allowed_ratios = _memo_neutral_ratios(oxidations, threshold,
+                                                  method)
+        else:
+            search = (neutral_ratios_array if method == 'numpy'
+                      else neutral_ratios_mitm)
+            allowed_ratios = search(oxidations, stoichs=stoichs,
+                                    threshold=threshold)
+        if not as_array:
+            allowed_ratios = [tuple(x) for x in allowed_ratios.tolist()]
+    elif method == 'python':
+        allowed_ratios = [x for x in neutral_ratios_iter(oxidations,
+                                                            stoichs=stoichs,
+                                                            threshold=threshold)]
+        if as_array:
+            allowed_ratios = np.array(allowed_ratios, dtype=np.int64).reshape(
+                -1, len(oxidations))
+    else:
+        raise ValueError("Unknown neutral_ratios method: {0}".format(method))
     return (len(allowed_ratios) > 0, allowed_ratios)
 
 # List of metals
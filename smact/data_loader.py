@@ -22,25 +22,102 @@ transparent data-caching system to avoid a large amount of I/O when
 naively constructing several of these objects.  It also implements a
 switchable system to print verbose warning messages about possible
 missing data (mainly for debugging purposes).
+
+Loading and lookups are instrumented: :func:`stats` reports how long
+each table took to load, how many bytes and rows it held, and how often
+each lookup was called and served from the cache.  Notable occurrences
+(tables loaded, data not found, ...) are reported as structured events,
+which are logged on the ``smact.data_loader`` logger at DEBUG level and
+passed to any hooks registered with :func:`add_event_hook`.
+
+The parsed tables are owned by a :class:`DataStore`, which loads each
+one on first use under a lock so that concurrent threads never parse a
+table twice or see it half-built.  The module-level ``lookup_*``
+functions query a default store; further stores may be created to hold
+alternative versions of any table side by side.  User corrections
+for individual elements can be layered over any per-element table with
+:func:`add_overlay`, which invalidates only the cached data derived
+from the elements it changes.
+
+Parsed tables can optionally be cached as JSON files, by default in
+a per-user cache directory (see :func:`set_cache`), so that later
+processes read them back instead of re-parsing the text files.  A
+cached table records a SHA-256 checksum of the contents of its source
+file and is re-parsed when that changes; if it cannot be written, the
+table is parsed as usual.  Each table is cached in a file of its own
+rather than all of them being compiled into a single bundle, so that
+only the tables used are read and an edited source file invalidates
+only its own table.  Caching is off unless switched on, as it saves
+only a few milliseconds per process.
 """
 from __future__ import print_function
 
-from builtins import next
-from builtins import map
-from builtins import zip
-import csv
+import functools
+import logging
 import os
+import threading
+import time
+from collections import namedtuple
+
+# csv, hashlib, json and NumPy are imported inside the functions which
+# use them, so that a plain `import smact` stays fast.
 
 from smact import data_directory
 
-# Module-level switch: print "verbose" warning messages
-# about missing data.
-_print_warnings = False
+logger = logging.getLogger(__name__)
+
+# Callables receiving every structured event.
+_event_hooks = []
+
+
+def add_event_hook(hook):
+    """Register a callable to receive data_loader events.
+
+    Each event is a dict with at least the keys 'event' (its type, e.g.
+    'table_loaded', 'cache_write_failed', 'missing_data',
+    'nearest_coordination' or
+    'data_changed') and 'message' (a readable description), plus fields
+    specific to its type.
+
+    Args:
+    hook (callable) : called with each event dict.
+    """
+
+    if hook not in _event_hooks:
+        _event_hooks.append(hook)
+
+
+def remove_event_hook(hook):
+    """Unregister a callable added with add_event_hook().
+
+    Args:
+    hook (callable) : the hook to remove.
+    """
+
+    if hook in _event_hooks:
+        _event_hooks.remove(hook)
+
+
+def _emit(event, message, level=logging.DEBUG, **fields):
+    """Log a structured event and pass it to the registered hooks"""
+
+    record = dict(fields, event=event, message=message)
+    logger.log(level, message, extra={'smact_event': record})
+    for hook in list(_event_hooks):
+        hook(record)
+
+
+def _print_warning(event):
+    """Event hook printing "verbose" warnings about missing data"""
+
+    if event['event'] in ('missing_data', 'cache_write_failed'):
+        print("WARNING: {0}".format(event['message']))
 
 
 def set_warnings(enable=True):
     """Set verbose warning messages on and off.
 
+    The warnings are printed by an event hook (see add_event_hook()).
     In order to see any of the warnings, this function needs to be
     called _before_ the first call to the smact.Element()
     constructor.
@@ -49,8 +126,10 @@ def set_warnings(enable=True):
     enable (bool) : print verbose warning messages.
     """
 
-    global _print_warnings
-    _print_warnings = enable
+    if enable:
+        add_event_hook(_print_warning)
+    else:
+        remove_event_hook(_print_warning)
 
 
 def _get_data_rows(filename):
@@ -68,8 +147,1352 @@ def float_or_None(x):
     except ValueError:
         return None
 
-# Loader and cache for the element oxidation-state data.
-_el_ox_states = None
+# Immutable records held in the data tables.  Lookups return the cached
+# records themselves, which are named tuples.  For the callers of the
+# dicts they replace, they behave as read-only dicts: iteration, `in`
+# and len() range over the field names, they compare equal to a dict of
+# the same items, and they support record['key'], get(), keys(),
+# values() and items(); copy() returns a plain (mutable) dict.  Fields
+# can also be read as attributes or by position, as in a named tuple.
+
+
+class _Record(tuple):
+    """Read-only mapping access for named-tuple records"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self._asdict() == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = tuple.__hash__
+
+    def __getnewargs__(self):
+        return self.values()
+
+    def _asdict(self):
+        """The record as a new dict"""
+        return dict(self.items())
+
+    def _replace(self, **fields):
+        """A copy of the record with some fields replaced"""
+        record = self._make(fields.pop(name, value)
+                            for name, value in self.items())
+        if fields:
+            raise ValueError("Got unexpected field names: {0!r}".format(
+                list(fields)))
+        return record
+
+    def get(self, key, default=None):
+        """Value of a field, or default if there is no such field"""
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        """Field names of the record"""
+        return self._fields
+
+    def values(self):
+        """Field values of the record"""
+        return tuple(tuple.__iter__(self))
+
+    def items(self):
+        """(field name, value) pairs of the record"""
+        return tuple(zip(self._fields, tuple.__iter__(self)))
+
+    def copy(self):
+        """The record as a new dict, which may be modified"""
+        return self._asdict()
+
+
+class ElementRecord(_Record, namedtuple('ElementRecord', (
+        'Symbol', 'Name', 'Z', 'Mass', 'r_cov', 'e_affinity', 'p_eig',
+        's_eig', 'Abundance', 'el_neg', 'ion_pot'))):
+    """One row of element_data.txt"""
+    __slots__ = ()
+
+
+class ShannonRadiusRecord(_Record, namedtuple('ShannonRadiusRecord', (
+        'charge', 'coordination', 'crystal_radius', 'ionic_radius',
+        'comment'))):
+    """One row of shannon_radii.csv"""
+    __slots__ = ()
+
+
+class SSERecord(_Record, namedtuple('SSERecord', (
+        'AtomicNumber', 'SolidStateEnergy', 'IonisationPotential',
+        'ElectronAffinity', 'MullikenElectronegativity',
+        'SolidStateRenormalisationEnergy'))):
+    """One row of SSE.csv"""
+    __slots__ = ()
+
+
+class SSE2015Record(_Record, namedtuple('SSE2015Record', (
+        'OxidationState', 'SolidStateEnergy2015'))):
+    """One row of SSE_2015.csv"""
+    __slots__ = ()
+
+
+class SSEPaulingRecord(_Record, namedtuple('SSEPaulingRecord', (
+        'SolidStateEnergyPauling',))):
+    """One row of SSE_Pauling.csv"""
+    __slots__ = ()
+
+# Parsers for the individual data tables.
+
+
+def _parse_ordered_periodic(filename):
+    """Parse ordered_periodic.txt into (symbols, {symbol: Z})"""
+
+    with open(filename, 'r') as file:
+        symbols = tuple(line.split()[0] for line in file if line.strip())
+
+    return symbols, {symbol: z for z, symbol in enumerate(symbols, start=1)}
+
+
+def _parse_oxidation_states(filename):
+    """Parse an oxidation_states*.txt table into {symbol: (states)}"""
+
+    return {items[0]: tuple(int(oxidationState)
+                            for oxidationState in items[1:])
+            for items in _get_data_rows(filename)}
+
+
+def _parse_hhis(filename):
+    """Parse HHIs.txt into {symbol: (HHI_p, HHI_R)}"""
+
+    return {items[0]: (float(items[1]), float(items[2]))
+            for items in _get_data_rows(filename)}
+
+
+def _parse_element_data(filename):
+    """Parse element_data.txt into {symbol: ElementRecord}"""
+
+    data = {}
+    for items in _get_data_rows(filename):
+        # First two columns are strings and should be left intact
+        # Everything else is numerical and should be cast to a float
+        # or, if not clearly a number, to None
+        clean_items = items[0:2] + list(map(float_or_None, items[2:]))
+
+        data[items[0]] = ElementRecord(*clean_items)
+
+    return data
+
+
+def _parse_shannon_radii(filename):
+    """Parse shannon_radii.csv into per-element and per-species dicts"""
+    import csv
+
+    data, index = {}, {}
+
+    with open(filename, 'r') as file:
+        reader = csv.reader(file)
+
+        # Skip the first row (headers).
+
+        next(reader)
+
+        for row in reader:
+            # For the shannon radii, there are multiple datasets for
+            # different element/oxidation-state/coordination
+            # combinations.
+
+            key = row[0]
+
+            dataset = ShannonRadiusRecord(
+                charge=int(row[1]),
+                coordination=row[2],
+                crystal_radius=float(row[3]),
+                ionic_radius=float(row[4]),
+                comment=row[5])
+
+            if key in data:
+                data[key].append(dataset)
+            else:
+                data[key] = [dataset]
+
+            # Later rows take precedence for repeated species
+            index[(key, dataset.charge, dataset.coordination)] = dataset
+
+    return {key: tuple(datasets) for key, datasets in data.items()}, index
+
+
+def _parse_sse(filename):
+    """Parse SSE.csv into {symbol: SSERecord}"""
+    import csv
+
+    data = {}
+
+    with open(filename, 'r') as file:
+        reader = csv.reader(file)
+
+        for row in reader:
+            data[row[0]] = SSERecord(
+                AtomicNumber=int(row[1]),
+                SolidStateEnergy=float(row[2]),
+                IonisationPotential=float(row[3]),
+                ElectronAffinity=float(row[4]),
+                MullikenElectronegativity=float(row[5]),
+                SolidStateRenormalisationEnergy=float(row[6]))
+
+    return data
+
+
+def _parse_sse2015(filename):
+    """Parse SSE_2015.csv into per-element and per-species dicts"""
+    import csv
+
+    data, index = {}, {}
+
+    with open(filename, 'r') as file:
+        reader = csv.reader(file)
+
+        for row in reader:
+            # Elements can have multiple SSE values depending on
+            # their oxidation state
+
+            key = row[0]
+
+            dataset = SSE2015Record(OxidationState=int(row[1]),
+                                    SolidStateEnergy2015=float(row[2]))
+
+            if key in data:
+                data[key].append(dataset)
+            else:
+                data[key] = [dataset]
+
+            index[(key, dataset.OxidationState)] = \
+                dataset.SolidStateEnergy2015
+
+    return {key: tuple(datasets) for key, datasets in data.items()}, index
+
+
+def _parse_sse_pauling(filename):
+    """Parse SSE_Pauling.csv into {symbol: SSEPaulingRecord}"""
+    import csv
+
+    with open(filename, 'r') as file:
+        return {row[0]: SSEPaulingRecord(float(row[1]))
+                for row in csv.reader(file)}
+
+# Every table a DataStore can hold, keyed by the name of its default
+# source file in smact/data.
+
+_TABLE_PARSERS = {
+    "ordered_periodic.txt": _parse_ordered_periodic,
+    "oxidation_states.txt": _parse_oxidation_states,
+    "oxidation_states_icsd.txt": _parse_oxidation_states,
+    "oxidation_states_SP.txt": _parse_oxidation_states,
+    "oxidation_states_pmg.txt": _parse_oxidation_states,
+    "HHIs.txt": _parse_hhis,
+    "element_data.txt": _parse_element_data,
+    "shannon_radii.csv": _parse_shannon_radii,
+    "SSE.csv": _parse_sse,
+    "SSE_2015.csv": _parse_sse2015,
+    "SSE_Pauling.csv": _parse_sse_pauling,
+}
+
+# Record types of the tables holding one record per element; overlays
+# may give just the fields to change for these.  Tables indexed by
+# anything other than element (the periodic index, Shannon radii and
+# SSE_2015) cannot be overlaid.
+
+_RECORD_TYPES = {
+    "element_data.txt": ElementRecord,
+    "SSE.csv": SSERecord,
+    "SSE_Pauling.csv": SSEPaulingRecord,
+}
+
+_INDEXED_TABLES = ("ordered_periodic.txt", "shannon_radii.csv",
+                   "SSE_2015.csv")
+
+# Named sets of oxidation states, mapped to the table holding them.
+# Sets added with register_oxidation_state_set() map to the path of
+# their file instead, and are never cached.
+
+_oxidation_state_sets = {
+    'default': "oxidation_states.txt",
+    'icsd': "oxidation_states_icsd.txt",
+    'sp': "oxidation_states_SP.txt",
+    'pmg': "oxidation_states_pmg.txt",
+}
+
+
+def oxidation_state_sets():
+    """
+    List the names of the registered oxidation-state sets.
+
+    Returns:
+        list: Set names, e.g. 'default', 'icsd', 'sp' and 'pmg'.
+    """
+
+    return sorted(_oxidation_state_sets)
+
+
+def register_oxidation_state_set(name, filename):
+    """
+    Register a file of oxidation states as a named set.
+
+    The file has the format of data/oxidation_states.txt: one line per
+    element, giving its symbol followed by its oxidation states.
+
+    Args:
+        name (str) : name under which to select the set.
+        filename (str) : path of the oxidation-state file.
+
+    Raises:
+        ValueError: If name is that of one of the built-in sets.
+    """
+
+    if _oxidation_state_sets.get(name) in _TABLE_PARSERS:
+        raise ValueError("Cannot replace the built-in oxidation-state set "
+                         "{0}".format(name))
+    path = os.path.abspath(filename)
+    previous = _oxidation_state_sets.get(name)
+    _oxidation_state_sets[name] = path
+    if previous is not None and previous != path:
+        # Results cached under this name are now stale
+        _emit('data_changed', "Oxidation-state set {0} now read from "
+              "{1}".format(name, path), table=path, symbols=None)
+
+
+def unregister_oxidation_state_set(name):
+    """
+    Remove a set added with register_oxidation_state_set().
+
+    Args:
+        name (str) : name of the set.
+
+    Raises:
+        ValueError: If the set is one of the built-in sets or was never
+            registered.
+    """
+
+    path = _oxidation_state_sets.get(name)
+    if path is None or path in _TABLE_PARSERS:
+        raise ValueError("No registered oxidation-state set {0}".format(name))
+    del _oxidation_state_sets[name]
+    _emit('data_changed', "Oxidation-state set {0} removed".format(name),
+          table=path, symbols=None)
+
+# Scalar elemental properties available as arrays from lookup_many(),
+# keyed by the name of the corresponding smact.Element attribute: the
+# table each comes from and the key of the value within an element's
+# record in that table.
+
+_PROPERTY_COLUMNS = {
+    'covalent_radius': ("element_data.txt", 'r_cov'),
+    'crustal_abundance': ("element_data.txt", 'Abundance'),
+    'e_affinity': ("element_data.txt", 'e_affinity'),
+    'eig': ("element_data.txt", 'p_eig'),
+    'eig_s': ("element_data.txt", 's_eig'),
+    'ionpot': ("element_data.txt", 'ion_pot'),
+    'mass': ("element_data.txt", 'Mass'),
+    'pauling_eneg': ("element_data.txt", 'el_neg'),
+    'HHI_p': ("HHIs.txt", 0),
+    'HHI_r': ("HHIs.txt", 1),
+    'SSE': ("SSE.csv", 'SolidStateEnergy'),
+    'SSEPauling': ("SSE_Pauling.csv", 'SolidStateEnergyPauling'),
+}
+
+# Columns of the array of Shannon radii returned by
+# lookup_shannon_radii_many(), one entry per row of shannon_radii.csv.
+# The module attribute SHANNON_RADII_DTYPE is the corresponding
+# numpy.dtype, built on first use like every NumPy object here so that
+# importing smact does not import NumPy.
+
+_SHANNON_RADII_FIELDS = [('symbol', 'U3'),
+                         ('number', 'i8'),
+                         ('charge', 'i8'),
+                         ('coordination', 'U4'),
+                         ('coordination_number', 'i8'),
+                         ('crystal_radius', 'f8'),
+                         ('ionic_radius', 'f8')]
+
+
+def __getattr__(name):
+    if name == 'SHANNON_RADII_DTYPE':
+        import numpy as np
+        return np.dtype(_SHANNON_RADII_FIELDS)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
+
+
+def _coordination_number(coordination):
+    """Number of neighbours in a Shannon environment, e.g. 6 for '6_n'"""
+    return int(str(coordination).split('_')[0])
+
+# Cache of parsed data tables.
+
+_CACHE_VERSION = 6
+
+
+def _default_cache_dir():
+    """Per-user cache directory, following the XDG convention"""
+
+    base = (os.environ.get('XDG_CACHE_HOME')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'smact')
+
+
+# Cache directory of the default store, or None if caching is off.
+cache_dir = None
+
+
+def _source_signature(path):
+    """(path, SHA-256 of the contents) identifying a source file version"""
+    import hashlib
+
+    path = os.path.abspath(path)
+    with open(path, 'rb') as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    return (path, digest)
+
+
+def _cache_file(directory, name, source):
+    """Cache file of a table, distinct for each of its source files"""
+    import hashlib
+
+    digest = hashlib.sha1(
+        os.path.abspath(source).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(directory, '{0}-{1}.json'.format(name, digest))
+
+
+# Record types which may be read back from cache files.
+_CACHED_RECORD_TYPES = {record_type.__name__: record_type for record_type in (
+    ElementRecord, ShannonRadiusRecord, SSERecord, SSE2015Record,
+    SSEPaulingRecord)}
+
+
+def _encode_table(value):
+    """A parsed table as JSON values, tagging the types JSON lacks"""
+
+    if isinstance(value, _Record):
+        return {'record': type(value).__name__,
+                'values': [_encode_table(item) for item in value.values()]}
+    if isinstance(value, tuple):
+        return {'tuple': [_encode_table(item) for item in value]}
+    if isinstance(value, dict):
+        return {'dict': [[_encode_table(key), _encode_table(item)]
+                         for key, item in value.items()]}
+    return value
+
+
+def _decode_table(value, records):
+    """Rebuild a table encoded by _encode_table
+
+    Equal records are shared through records, as they are in the parsed
+    tables indexed both by element and by species.
+    """
+
+    if not isinstance(value, dict):
+        return value
+    if 'record' in value:
+        record_type = _CACHED_RECORD_TYPES[value['record']]
+        record = record_type._make(_decode_table(item, records)
+                                   for item in value['values'])
+        return records.setdefault((record_type, record), record)
+    if 'tuple' in value:
+        return tuple(_decode_table(item, records) for item in value['tuple'])
+    return {_decode_table(key, records): _decode_table(item, records)
+            for key, item in value['dict']}
+
+
+def _write_cache_file(path, signature, table):
+    """Atomically write a cached table"""
+    import json
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+    try:
+        with open(tmp_path, 'w') as file:
+            json.dump({'version': _CACHE_VERSION,
+                       'source': list(signature),
+                       'table': _encode_table(table)},
+                      file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_cache_file(path, signature):
+    """A cached table, or None if missing, unreadable or out of date"""
+    import json
+
+    try:
+        with open(path, 'r') as file:
+            cached = json.load(file)
+        if (cached.get('version') != _CACHE_VERSION
+                or cached.get('source') != list(signature)):
+            return None
+        return _decode_table(cached['table'], {})
+    except Exception:
+        # Any unreadable cache file is treated as missing and rewritten
+        return None
+
+
+def _count_rows(table):
+    """Number of rows of a parsed data table"""
+
+    if isinstance(table, tuple):
+        # (datasets, index) tables; the periodic index is (symbols, Z)
+        table = table[0]
+    if isinstance(table, dict):
+        # Elements may have several rows, e.g. one per Shannon radius
+        return sum(len(value) if isinstance(value, tuple) and value
+                   and isinstance(value[0], _Record) else 1
+                   for value in table.values())
+    return len(table)
+
+
+def _counted(lookup):
+    """Record calls, cache hits and missing results of a DataStore lookup
+
+    A call is a hit if it was answered without loading a table.
+    Counts are updated without locking, so may be approximate when
+    lookups are made concurrently from several threads.
+    """
+
+    name = lookup.__name__
+
+    @functools.wraps(lookup)
+    def counted_lookup(self, *args, **kwargs):
+        loads = self._load_count
+        result = lookup(self, *args, **kwargs)
+
+        counts = self._lookup_counts.get(name)
+        if counts is None:
+            counts = self._lookup_counts.setdefault(
+                name, {'calls': 0, 'hits': 0, 'missing': 0})
+        counts['calls'] += 1
+        if self._load_count == loads:
+            counts['hits'] += 1
+        if result is None:
+            counts['missing'] += 1
+        return result
+
+    return counted_lookup
+
+
+class DataStore(object):
+    """
+    Thread-safe owner of the parsed data tables.
+
+    Each table is parsed (or read from the cache) the first time it is
+    needed and cached for the lifetime of the store, with
+    any user overlay (see :meth:`add_overlay`) applied on top.  The
+    lookup methods mirror the module-level ``lookup_*`` functions, which
+    delegate to the default store.
+
+    Attributes:
+        sources (dict): Path of the source file for each table, keyed by
+            table name (the name of its default file in smact/data).
+        cache_dir (str): Directory of cached parsed tables, or None to
+            always parse the source files.
+
+    Args:
+        sources (Optional(dict)): Replacement source files for any of the
+            tables, e.g. ``{'oxidation_states.txt': 'my_states.txt'}``.
+        cache_dir (Optional(str)): Directory of cached parsed tables.
+    """
+
+    def __init__(self, sources=None, cache_dir=None):
+        self.sources = {name: os.path.join(data_directory, name)
+                        for name in _TABLE_PARSERS}
+        if sources is not None:
+            for name in sources:
+                if name not in _TABLE_PARSERS:
+                    raise ValueError("Unknown data table {0}; expected one "
+                                     "of {1}".format(name,
+                                                     sorted(_TABLE_PARSERS)))
+            self.sources.update(sources)
+        self.cache_dir = cache_dir
+
+        self._lock = threading.RLock()
+        self._tables = {}
+        self._base_tables = {}
+        self._overlays = {}
+        self._arrays = {}
+
+        self._load_count = 0
+        self._table_stats = {}
+        self._lookup_counts = {}
+
+    def is_loaded(self, name):
+        """Return True if the named table has been loaded into the store"""
+        return name in self._tables
+
+    def _table(self, name):
+        """Retrieve a table, loading it on first use"""
+
+        # Fast path without the lock: a table is only ever published to
+        # _tables once it is complete.
+        try:
+            return self._tables[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if name not in self._tables:
+                base = self._load(name)
+                self._base_tables[name] = base
+                self._tables[name] = self._overlaid(name, base)
+            return self._tables[name]
+
+    def _arrays_for(self, key, build):
+        """Retrieve derived read-only arrays, building them on first use"""
+
+        try:
+            return self._arrays[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._arrays:
+                arrays = build()
+                for array in arrays:
+                    array.setflags(write=False)
+                self._arrays[key] = arrays
+                self._load_count += 1
+            return self._arrays[key]
+
+    def _load(self, name):
+        """Produce a table from the cache or its source (lock held)"""
+
+        start = time.perf_counter()
+
+        if name not in self.sources:
+            # A registered oxidation-state set, keyed by its path
+            source, table = name, _parse_oxidation_states(name)
+        elif self.cache_dir is None:
+            source = self.sources[name]
+            table = _TABLE_PARSERS[name](source)
+        else:
+            source, table = self._load_cached(name)
+
+        stats = {'source': source,
+                 'seconds': time.perf_counter() - start,
+                 'bytes': os.path.getsize(source),
+                 'rows': _count_rows(table)}
+        self._table_stats[name] = stats
+        self._load_count += 1
+        _emit('table_loaded', "Loaded {0} ({1} rows) from {2} in "
+              "{3:.4f} s".format(name, stats['rows'], source,
+                                 stats['seconds']),
+              table=name, **stats)
+        return table
+
+    def _load_cached(self, name):
+        """Read a table from the cache, or parse and cache it (lock held)
+
+        Returns:
+            (source, table): source is the file actually read.
+        """
+
+        source = self.sources[name]
+        # Taken before parsing, so that a source edited meanwhile leaves
+        # the cached table out of date rather than silently wrong.
+        signature = _source_signature(source)
+        path = _cache_file(self.cache_dir, name, source)
+
+        table = _read_cache_file(path, signature)
+        if table is not None:
+            return path, table
+
+        table = _TABLE_PARSERS[name](source)
+        try:
+            _write_cache_file(path, signature, table)
+        except OSError as error:
+            _emit('cache_write_failed', "Could not cache {0} in {1}: "
+                  "{2}".format(name, path, error),
+                  level=logging.INFO, table=name, path=path)
+        return source, table
+
+    def stats(self):
+        """
+        Snapshot of the store's load timings and lookup counts.
+
+        Returns:
+            dict: with keys
+
+            tables
+                for each loaded table, a dict of its 'source' (file
+                read, which is in cache_dir if it was cached), load
+                time in 'seconds', 'bytes' read and 'rows'
+            lookups
+                for each lookup method called, a dict of its 'calls',
+                cache 'hits' (answered without loading a table) and
+                'missing' (None) results
+        """
+
+        with self._lock:
+            return {
+                'tables': {name: dict(stats) for name, stats
+                           in list(self._table_stats.items())},
+                'lookups': {name: dict(counts) for name, counts
+                            in list(self._lookup_counts.items())}}
+
+    def build_cache(self, path=None):
+        """
+        Parse every data table and write it to the cache.
+
+        Args:
+            path (Optional(str)) : cache directory; defaults to cache_dir.
+
+        Returns:
+            dict: Parsed tables, keyed by table name.
+        """
+
+        directory = self.cache_dir if path is None else path
+        tables = {}
+        for name, parser in _TABLE_PARSERS.items():
+            source = self.sources[name]
+            signature = _source_signature(source)
+            tables[name] = parser(source)
+            _write_cache_file(_cache_file(directory, name, source),
+                              signature, tables[name])
+        return tables
+
+    # User overlays; see the module-level functions of the same names.
+
+    def _overlaid(self, name, base):
+        """A table with any overlay applied on top of it"""
+
+        overlay = self._overlays.get(name)
+        if not overlay:
+            return base
+
+        table = dict(base)
+        for symbol, value in overlay.items():
+            if isinstance(value, dict):
+                # Fields to change in the element's record
+                record = base.get(symbol)
+                if record is None:
+                    record = _RECORD_TYPES[name](
+                        *(None,) * len(_RECORD_TYPES[name]._fields))
+                value = record._replace(**value)
+            table[symbol] = value
+        return table
+
+    def _refresh(self, name, symbols):
+        """Reapply the overlay of a table and report changed elements"""
+
+        with self._lock:
+            if name in self._base_tables:
+                self._tables[name] = self._overlaid(
+                    name, self._base_tables[name])
+            numbers = [z for z, symbol in enumerate(
+                           self._table("ordered_periodic.txt")[0], start=1)
+                       if symbol in symbols]
+            for key in list(self._arrays):
+                if key == name:
+                    # Oxidation states are rebuilt in full on next use
+                    del self._arrays[key]
+                elif _PROPERTY_COLUMNS.get(key, (None,))[0] == name:
+                    # Update the changed elements in a copy, as lock-free
+                    # readers may still be using the current column
+                    column = self._arrays[key][0].copy()
+                    self._fill_property_column(key, column, numbers)
+                    column.setflags(write=False)
+                    self._arrays[key] = (column,)
+
+        _emit('data_changed', "Data for {0} in {1} changed".format(
+                  ", ".join(symbols), name),
+              table=name, symbols=tuple(symbols), store=self)
+
+    def add_overlay(self, name, data):
+        """Layer user data for some elements over a table"""
+
+        if name in _INDEXED_TABLES or (
+                name not in self.sources
+                and name not in _oxidation_state_sets.values()):
+            raise ValueError("Cannot overlay data table {0}".format(name))
+
+        if isinstance(data, str):
+            data = _TABLE_PARSERS.get(name, _parse_oxidation_states)(data)
+
+        record_type = _RECORD_TYPES.get(name)
+        overlay = {}
+        for symbol, value in data.items():
+            if isinstance(value, dict):
+                if record_type is None:
+                    raise ValueError("Table {0} has no fields to "
+                                     "overlay".format(name))
+                unknown = set(value) - set(record_type._fields)
+                if unknown:
+                    raise ValueError("Unknown fields {0} for table "
+                                     "{1}".format(sorted(unknown), name))
+                value = dict(value)
+            elif record_type is not None:
+                value = record_type(*value)
+            else:
+                value = tuple(value)
+            overlay[symbol] = value
+
+        with self._lock:
+            self._overlays[name] = dict(self._overlays.get(name, {}),
+                                        **overlay)
+        self._refresh(name, overlay)
+
+    def remove_overlay(self, name, symbols=None):
+        """Restore the original data of some or all overlaid elements"""
+
+        with self._lock:
+            overlay = self._overlays.get(name, {})
+            if symbols is None:
+                symbols = list(overlay)
+            symbols = [symbol for symbol in symbols if symbol in overlay]
+            if not symbols:
+                return
+            self._overlays[name] = {symbol: value
+                                    for symbol, value in overlay.items()
+                                    if symbol not in symbols}
+        self._refresh(name, symbols)
+
+    def overlays(self):
+        """Symbols of the overlaid elements, keyed by table name"""
+        return {name: sorted(overlay)
+                for name, overlay in self._overlays.items() if overlay}
+
+    # Bulk lookups returning arrays indexed by proton number.
+
+    def _build_property_column(self, prop):
+        """Float array of one property indexed by Z, NaN where missing"""
+        import numpy as np
+
+        n_elements = len(self._table("ordered_periodic.txt")[0])
+        column = np.full(n_elements + 1, np.nan)
+        self._fill_property_column(prop, column, range(1, n_elements + 1))
+        return (column,)
+
+    def _fill_property_column(self, prop, column, numbers):
+        """Set the entries of a property column for some elements"""
+        import numpy as np
+
+        table_name, key = _PROPERTY_COLUMNS[prop]
+        table = self._table(table_name)
+        symbols = self._table("ordered_periodic.txt")[0]
+
+        for z in numbers:
+            record = table.get(symbols[z - 1])
+            if record is not None and record[key] is not None:
+                column[z] = record[key]
+            else:
+                column[z] = np.nan
+
+    def _build_oxidation_state_csr(self, name):
+        """CSR (offsets, values) arrays of an oxidation-state table"""
+        import numpy as np
+
+        table = self._table(name)
+        states = [table.get(symbol, ())
+                  for symbol in self._table("ordered_periodic.txt")[0]]
+
+        offsets = np.zeros(len(states) + 2, dtype=np.int64)
+        offsets[2:] = np.cumsum([len(element_states)
+                                 for element_states in states])
+        values = np.array([state for element_states in states
+                           for state in element_states], dtype=np.int64)
+        return offsets, values
+
+    def _build_shannon_radii_array(self):
+        """Structured array of every Shannon radius, in file order"""
+        import numpy as np
+
+        atomic_numbers = self._table("ordered_periodic.txt")[1]
+        rows = [(symbol, atomic_numbers.get(symbol, 0), record.charge,
+                 record.coordination,
+                 _coordination_number(record.coordination),
+                 record.crystal_radius, record.ionic_radius)
+                for symbol, records in self._table("shannon_radii.csv")[0].items()
+                for record in records]
+        return (np.array(rows, dtype=_SHANNON_RADII_FIELDS),)
+
+    @_counted
+    def lookup_atomic_numbers(self, elements):
+        """Proton numbers of symbols or Z values, with 0 for unknowns"""
+        return self._atomic_numbers(elements)
+
+    def _atomic_numbers(self, elements):
+        """Uncounted implementation of lookup_atomic_numbers"""
+        import numpy as np
+
+        elements = np.asarray(elements)
+        n_elements = len(self._table("ordered_periodic.txt")[0])
+
+        if elements.dtype.kind in 'iu':
+            numbers = elements.astype(np.int64)
+            numbers[(numbers < 1) | (numbers > n_elements)] = 0
+            return numbers
+
+        atomic_numbers = self._table("ordered_periodic.txt")[1]
+        return np.array([atomic_numbers.get(symbol, 0)
+                         for symbol in elements.ravel()],
+                        dtype=np.int64).reshape(elements.shape)
+
+    @_counted
+    def lookup_many(self, prop, elements):
+        """Array of one property for many elements, NaN where missing"""
+
+        if prop not in _PROPERTY_COLUMNS:
+            raise ValueError("Unknown property {0}; expected one of "
+                             "{1}".format(prop, sorted(_PROPERTY_COLUMNS)))
+
+        column, = self._arrays_for(
+            prop, lambda: self._build_property_column(prop))
+        return column[self._atomic_numbers(elements)]
+
+    @_counted
+    def lookup_oxidation_states_many(self, elements,
+                                     oxidation_states_set='default'):
+        """CSR (offsets, values) oxidation states of many elements"""
+        import numpy as np
+
+        name = self._oxidation_state_table(oxidation_states_set)
+        all_offsets, all_values = self._arrays_for(
+            name, lambda: self._build_oxidation_state_csr(name))
+
+        numbers = self._atomic_numbers(elements).ravel()
+        starts = all_offsets[numbers]
+        counts = all_offsets[numbers + 1] - starts
+
+        offsets = np.zeros(len(numbers) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        # Position of every output value within all_values
+        index = (np.repeat(starts - offsets[:-1], counts)
+                 + np.arange(offsets[-1]))
+        return offsets, all_values[index]
+
+    @_counted
+    def lookup_shannon_radii_many(self, elements=None, charges=None,
+                                  coordinations=None):
+        """Shannon radii matching any of the given values of each field"""
+        import numpy as np
+
+        radii, = self._arrays_for("shannon_radii",
+                                  self._build_shannon_radii_array)
+
+        mask = np.ones(len(radii), dtype=bool)
+        if elements is not None:
+            numbers = self._atomic_numbers(elements)
+            mask &= np.isin(radii['number'], numbers[numbers > 0])
+        if charges is not None:
+            mask &= np.isin(radii['charge'], np.asarray(charges, dtype=int))
+        if coordinations is not None:
+            mask &= np.isin(radii['coordination'],
+                            np.asarray(coordinations, dtype=str))
+        return radii[mask]
+
+    # Lookups; see the module-level functions of the same names.
+
+    @_counted
+    def lookup_ordered_symbols(self):
+        """Element symbols ordered by proton number"""
+        return self._table("ordered_periodic.txt")[0]
+
+    @_counted
+    def lookup_atomic_number(self, symbol):
+        """Proton number of an element, or None"""
+
+        atomic_numbers = self._table("ordered_periodic.txt")[1]
+
+        if symbol in atomic_numbers:
+            return atomic_numbers[symbol]
+        else:
+            _emit('missing_data', "Element {0} not found in the periodic "
+                  "table.".format(symbol), key=symbol)
+            return None
+
+    @_counted
+    def lookup_element_symbol(self, number):
+        """Symbol of the element with a given proton number, or None"""
+
+        symbols = self._table("ordered_periodic.txt")[0]
+
+        if 1 <= number <= len(symbols):
+            return symbols[number - 1]
+        else:
+            _emit('missing_data', "No element with proton number "
+                  "{0}.".format(number), key=number)
+            return None
+
+    def _oxidation_state_table(self, oxidation_states_set):
+        """Name of the table holding a named oxidation-state set"""
+
+        try:
+            return _oxidation_state_sets[oxidation_states_set]
+        except KeyError:
+            raise ValueError("Unknown oxidation-state set {0}; expected one "
+                             "of {1}".format(oxidation_states_set,
+                                             oxidation_state_sets()))
+
+    @_counted
+    def lookup_oxidation_state_set(self, symbol,
+                                   oxidation_states_set='default'):
+        """Oxidation states of an element from a named set"""
+        return self._lookup_oxidation_states(
+            self._oxidation_state_table(oxidation_states_set), symbol)
+
+    def _lookup_oxidation_states(self, name, symbol):
+        """Oxidation states of an element from one of the state tables"""
+
+        oxidation_states = self._table(name)
+
+        if symbol in oxidation_states:
+            return oxidation_states[symbol]
+        else:
+            _emit('missing_data', "Oxidation states for element {0} "
+                  "not found.".format(symbol), table=name, key=symbol)
+            return None
+
+    @_counted
+    def lookup_element_oxidation_states(self, symbol, copy=True):
+        """Default (most exhaustive) oxidation states of an element"""
+        return self._lookup_oxidation_states("oxidation_states.txt",
+                                             symbol)
+
+    @_counted
+    def lookup_element_oxidation_states_icsd(self, symbol, copy=True):
+        """ICSD oxidation states of an element"""
+        return self._lookup_oxidation_states("oxidation_states_icsd.txt",
+                                             symbol)
+
+    @_counted
+    def lookup_element_oxidation_states_sp(self, symbol, copy=True):
+        """Structure-prediction oxidation states of an element"""
+        return self._lookup_oxidation_states("oxidation_states_SP.txt",
+                                             symbol)
+
+    @_counted
+    def lookup_element_hhis(self, symbol):
+        """(HHI_p, HHI_R) scores of an element, or None"""
+
+        element_hhis = self._table("HHIs.txt")
+
+        if symbol in element_hhis:
+            return element_hhis[symbol]
+        else:
+            _emit('missing_data', "HHI data for element "
+                  "{0} not found.".format(symbol), key=symbol)
+
+            return None
+
+    @_counted
+    def lookup_element_data(self, symbol, copy=True):
+        """Tabulated data for an element from element_data.txt, or None"""
+
+        element_data = self._table("element_data.txt")
+
+        if symbol in element_data:
+            return element_data[symbol]
+        else:
+            _emit('missing_data', "Elemental data for {0}"
+                  " not found.".format(symbol), key=symbol)
+            return None
+
+    @_counted
+    def lookup_element_shannon_radius_data(self, symbol, copy=True):
+        """Shannon radii datasets for all states of an element, or None"""
+
+        shannon_radii_data = self._table("shannon_radii.csv")[0]
+
+        if symbol in shannon_radii_data:
+            return shannon_radii_data[symbol]
+        else:
+            _emit('missing_data', "Shannon-radius data for element {0} not "
+                  "found.".format(symbol), key=symbol)
+
+            return None
+
+    @_counted
+    def lookup_species_shannon_radius_data(self, symbol, charge,
+                                           coordination, copy=True,
+                                           nearest=False):
+        """Shannon radii dataset for one species, or None"""
+
+        shannon_radii_data, shannon_radii_index = \
+            self._table("shannon_radii.csv")
+
+        key = (symbol, charge, coordination)
+
+        if key in shannon_radii_index:
+            return shannon_radii_index[key]
+
+        if nearest:
+            target = _coordination_number(coordination)
+            candidates = [record for record
+                          in shannon_radii_data.get(symbol, ())
+                          if record.charge == charge]
+            if candidates:
+                # Ties go to the lower coordination number
+                record = min(candidates, key=lambda record: (
+                    abs(_coordination_number(record.coordination) - target),
+                    _coordination_number(record.coordination)))
+                _emit('nearest_coordination', "Using Shannon radius of {0} "
+                      "in oxidation state {1} and coordination {2} in place "
+                      "of coordination {3}.".format(
+                          symbol, charge, record.coordination, coordination),
+                      key=key, coordination=record.coordination)
+                return shannon_radii_index[
+                    (symbol, charge, record.coordination)]
+
+        _emit('missing_data', "Shannon-radius data for {0} in "
+              "oxidation state {1} and coordination {2} not "
+              "found.".format(*key), key=key)
+
+        return None
+
+    @_counted
+    def lookup_element_sse_data(self, symbol):
+        """Solid-state energy dataset of an element, or None"""
+
+        element_ssedata = self._table("SSE.csv")
+
+        if symbol in element_ssedata:
+            return element_ssedata[symbol]
+        else:
+            _emit('missing_data', "Solid-state energy data for element {0} "
+                  "not found.".format(symbol), key=symbol)
+
+            return None
+
+    @_counted
+    def lookup_element_sse2015_data(self, symbol, copy=True):
+        """SSE (2015) datasets of an element, or None"""
+
+        element_sse2015_data = self._table("SSE_2015.csv")[0]
+
+        if symbol in element_sse2015_data:
+            return element_sse2015_data[symbol]
+        else:
+            _emit('missing_data', "Solid-state energy (revised 2015) data "
+                  "for element {0} not found.".format(symbol), key=symbol)
+
+            return None
+
+    @_counted
+    def lookup_species_sse2015(self, symbol, oxidation):
+        """SSE (2015) of an element in one oxidation state, or None"""
+
+        sse2015_index = self._table("SSE_2015.csv")[1]
+
+        key = (symbol, oxidation)
+
+        if key in sse2015_index:
+            return sse2015_index[key]
+        else:
+            _emit('missing_data', "Solid-state energy (revised 2015) data "
+                  "for {0} in oxidation state {1} not found.".format(*key),
+                  key=key)
+
+            return None
+
+    @_counted
+    def lookup_element_sse_pauling_data(self, symbol):
+        """Pauling-regression SSE dataset of an element, or None"""
+
+        element_ssepauling_data = self._table("SSE_Pauling.csv")
+
+        if symbol in element_ssepauling_data:
+            return element_ssepauling_data[symbol]
+        else:
+            _emit('missing_data', "Solid-state energy data from Pauling "
+                  "electronegativity regression fit for "
+                  "element {0} not found.".format(symbol), key=symbol)
+
+            return None
+
+# The store queried by the module-level lookup functions.
+
+_default_store = DataStore(cache_dir=cache_dir)
+
+
+def get_default_store():
+    """Return the DataStore used by the module-level lookup functions."""
+    return _default_store
+
+
+def set_default_store(store):
+    """
+    Replace the DataStore used by the module-level lookup functions.
+
+    Args:
+        store (DataStore) : the new default store.
+    """
+
+    global _default_store
+    _default_store = store
+    _emit('data_changed', "Default data store replaced", table=None,
+          symbols=None, store=store)
+
+
+def set_cache(enable=True, path=None):
+    """Switch the cache of parsed data tables on and off.
+
+    This replaces the default store, so any tables it had already loaded
+    will be read again on next use.
+
+    The cache files are JSON, so reading them cannot run code, but a
+    table read from a directory writable by others may have been
+    altered.
+
+    Args:
+    enable (bool) : read tables from the cache, (re)writing any that are
+        missing or out of date, rather than always parsing the text files.
+    path (Optional(str)) : cache directory; by default "smact" in the
+        user's cache directory ($XDG_CACHE_HOME or ~/.cache).
+    """
+
+    global cache_dir
+    if enable:
+        cache_dir = _default_cache_dir() if path is None else path
+    else:
+        cache_dir = None
+    set_default_store(DataStore(cache_dir=cache_dir))
+
+
+def build_cache(path=None):
+    """
+    Parse every data table and write it to the cache.
+
+    Tables are otherwise cached one at a time as they are first used;
+    this is an explicit build step, e.g. for a shared cache directory.
+
+    Args:
+        path (Optional(str)) : cache directory; defaults to the one in
+            use, or else the default of :func:`set_cache`.
+
+    Returns:
+        dict: Parsed tables, keyed by source file name.
+    """
+
+    if path is None:
+        path = _default_cache_dir() if cache_dir is None else cache_dir
+    return _default_store.build_cache(path)
+
+# User data layered over the data tables.
+
+
+def add_overlay(table, data):
+    """
+    Layer user data for some elements over one of the data tables.
+
+    Overlaid elements take their data from the overlay instead of the
+    table; all other elements are unaffected.  Only caches derived from
+    the changed elements are invalidated: a 'data_changed' event
+    naming them is emitted (see :func:`add_event_hook`), on which
+    interned :class:`smact.Element` and :class:`smact.Species` objects
+    and cached screening results for those elements are discarded.
+    Objects already held by the caller keep the old values.
+
+    e.g. to correct the Pauling electronegativity and default oxidation
+    states of Fe::
+
+        add_overlay('element_data.txt', {'Fe': {'el_neg': 1.9}})
+        add_overlay('oxidation_states.txt', {'Fe': (2, 3)})
+
+    Args:
+        table (str) : name of the table, i.e. of its file in smact/data
+            (e.g. 'oxidation_states_icsd.txt'), or the path of a
+            registered oxidation-state set.  The periodic index, Shannon
+            radii and SSE_2015 tables cannot be overlaid.
+        data (dict or str) : the new data keyed by element symbol, or
+            the path of a file in the format of the table.  For
+            element_data.txt, SSE.csv and SSE_Pauling.csv a value may be
+            a dict of just the record fields to change.
+
+    Raises:
+        ValueError: The table cannot be overlaid or a field is unknown.
+    """
+
+    _default_store.add_overlay(table, data)
+
+
+def remove_overlay(table, symbols=None):
+    """
+    Restore the original data of overlaid elements.
+
+    Args:
+        table (str) : name of the table, as for :func:`add_overlay`.
+        symbols (Optional(list)) : elements to restore; defaults to all
+            the elements overlaid in this table.
+    """
+
+    _default_store.remove_overlay(table, symbols)
+
+
+def overlays():
+    """
+    List the elements overlaid with :func:`add_overlay`.
+
+    Returns:
+        dict: Sorted lists of element symbols, keyed by table name.
+    """
+
+    return _default_store.overlays()
+
+# Periodic-table ordering of the elements.
+
+
+def lookup_ordered_symbols():
+    """
+    Retrieve all element symbols ordered by proton number.
+
+    Returns:
+        tuple: Element symbols; the element with proton number Z is at
+            index Z - 1.
+    """
+
+    return _default_store.lookup_ordered_symbols()
+
+
+def lookup_atomic_number(symbol):
+    """
+    Retrieve the proton number of an element.
+
+    Args:
+        symbol (str) : the atomic symbol of the element to look up.
+
+    Returns:
+        int: Proton number, or None if the symbol is not recognised.
+    """
+
+    return _default_store.lookup_atomic_number(symbol)
+
+
+def lookup_element_symbol(number):
+    """
+    Retrieve the symbol of the element with a given proton number.
+
+    Args:
+        number (int) : proton number of the element to look up.
+
+    Returns:
+        str: Element symbol, or None if the number is out of range.
+    """
+
+    return _default_store.lookup_element_symbol(number)
+
+# Element oxidation-state data.
 
 
 def lookup_element_oxidation_states(symbol, copy=True):
@@ -80,44 +1503,19 @@ def lookup_element_oxidation_states(symbol, copy=True):
 
     Args:
         symbol (str) : the atomic symbol of the element to look up.
-        copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+        copy (Optional(bool)): ignored; retained for compatibility as
+            the cached tuple is immutable and returned directly.
 
     Returns:
-        list: List of known oxidation states for the element.
+        tuple: Known oxidation states for the element.  This was a list
+            in SMACT 1.2 and earlier; a tuple does not compare equal to
+            a list of the same states, so use list() where one is needed.
 
             Return None if oxidation states for the Element were not
             found in the external data.
     """
 
-    global _el_ox_states
-
-    if _el_ox_states is None:
-        _el_ox_states = {}
-
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "oxidation_states.txt")):
-            _el_ox_states[items[0]] = [int(oxidationState)
-                                       for oxidationState in items[1:]]
-
-    if symbol in _el_ox_states:
-        if copy:
-            # _el_ox_states stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
-
-            return [oxidationState for oxidationState in _el_ox_states[symbol]]
-        else:
-            return _el_ox_states[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Oxidation states for element {0} "
-                  "not found.".format(symbol))
-        return None
-
-_el_ox_states_icsd = None
+    return _default_store.lookup_element_oxidation_states(symbol, copy)
 
 
 def lookup_element_oxidation_states_icsd(symbol, copy=True):
@@ -128,29 +1526,20 @@ def lookup_element_oxidation_states_icsd(symbol, copy=True):
 
     Args:
         symbol (str) : the atomic symbol of the element to look up.
-        copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+        copy (Optional(bool)): ignored; retained for compatibility as
+            the cached tuple is immutable and returned directly.
 
     Returns:
-        list: List of known oxidation states for the element.
+        tuple: Known oxidation states for the element.  This was a list
+            in SMACT 1.2 and earlier; a tuple does not compare equal to
+            a list of the same states, so use list() where one is needed.
 
             Return None if oxidation states for the Element were not
             found in the external data.
     """
 
-    global _el_ox_states_icsd
-
-    if _el_ox_states_icsd is None:
-        _el_ox_states_icsd = {}
-
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "oxidation_states_icsd.txt")):
-            _el_ox_states_icsd[items[0]] = [int(oxidationState)
-                                       for oxidationState in items[1:]]
+    return _default_store.lookup_element_oxidation_states_icsd(symbol, copy)
 
-_el_ox_states_sp = None
 
 def lookup_element_oxidation_states_sp(symbol, copy=True):
     """
@@ -160,47 +1549,39 @@ def lookup_element_oxidation_states_sp(symbol, copy=True):
 
     Args:
         symbol (str) : the atomic symbol of the element to look up.
-        copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+        copy (Optional(bool)): ignored; retained for compatibility as
+            the cached tuple is immutable and returned directly.
 
     Returns:
-        list: List of known oxidation states for the element.
+        tuple: Known oxidation states for the element.  This was a list
+            in SMACT 1.2 and earlier; a tuple does not compare equal to
+            a list of the same states, so use list() where one is needed.
 
             Return None if oxidation states for the Element were not
             found in the external data.
     """
 
-    global _el_ox_states_sp
+    return _default_store.lookup_element_oxidation_states_sp(symbol, copy)
 
-    if _el_ox_states_sp is None:
-        _el_ox_states_sp = {}
-
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "oxidation_states_SP.txt")):
-            _el_ox_states_sp[items[0]] = [int(oxidationState)
-                                       for oxidationState in items[1:]]
 
+def lookup_oxidation_state_set(symbol, oxidation_states_set='default'):
+    """
+    Retrieve the oxidation states of an element from a named set.
 
-    if symbol in _el_ox_states_sp:
-        if copy:
-            # _el_ox_states_sp stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
+    Args:
+        symbol (str) : the atomic symbol of the element to look up.
+        oxidation_states_set (str) : name of the oxidation-state set,
+            see :func:`oxidation_state_sets`.
 
-            return [oxidationState for oxidationState in _el_ox_states_sp[symbol]]
-        else:
-            return _el_ox_states_sp[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Oxidation states for element {0} "
-                  "not found.".format(symbol))
-        return None
+    Returns:
+        tuple: Oxidation states of the element in the set, or None if
+            the element is not listed.
+    """
 
-# Loader and cache for the element HHI scores.
+    return _default_store.lookup_oxidation_state_set(symbol,
+                                                     oxidation_states_set)
 
-_element_hhis = None
+# Element HHI scores.
 
 
 def lookup_element_hhis(symbol):
@@ -215,93 +1596,33 @@ def lookup_element_hhis(symbol):
         not found in the external data.
     """
 
-    global _element_hhis
+    return _default_store.lookup_element_hhis(symbol)
 
-    if _element_hhis is None:
-        _element_hhis = {}
+# Elemental data
 
-        with open(os.path.join(data_directory, "HHIs.txt"),
-                  'r') as file:
-            for line in file:
-                line = line.strip()
-
-                if line[0] != '#':
-                    items = line.split()
-
-                    _element_hhis[items[0]] = (float(items[1]),
-                                               float(items[2]))
-
-    if symbol in _element_hhis:
-        return _element_hhis[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: HHI data for element "
-                  "{0} not found.".format(symbol))
-
-        return None
-
-# Loader and cache for elemental data
-
-_element_data = None
 
 def lookup_element_data(symbol, copy=True):
     """
     Retrieve tabulated data for an element.
 
     The table "data/element_data.txt" contains a collection of relevant
-    atomic data. If a cache exists in the form of the module-level
-    variable _element_data, this is returned. Otherwise, a dictionary is
-    constructed from the data table and cached before returning it.
+    atomic data, parsed once and cached by the default DataStore.
 
     Args:
         symbol (str) : Atomic symbol for lookup
 
-        copy (Optional(bool)) : if True (default), return a copy of the
-            data dictionary, rather than a reference to the cached
-            object -- only used copy=False in performance-sensitive code
-            and where you are certain the dictionary will not be
-            modified!
-
-    Returns (dict): Dictionary of data for given element, keyed by
-        column headings from data/element_data.txt
-    """
-    global _element_data
-    if _element_data is None:
-        _element_data = {}
-        keys = ('Symbol', 'Name', 'Z', 'Mass', 'r_cov', 'e_affinity',
-                'p_eig', 's_eig', 'Abundance', 'el_neg', 'ion_pot')
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "element_data.txt")):
-            # First two columns are strings and should be left intact
-            # Everything else is numerical and should be cast to a float
-            # or, if not clearly a number, to None
-            clean_items = items[0:2] + list(map(float_or_None, items[2:]))
-
-            _element_data.update({items[0]:
-                                  dict(list(zip(keys, clean_items)))})
-
-    if symbol in _element_data:
-        if copy:
-            # _element_open_babel_derived_data stores dictionaries
-            # -> if copy is set, use the dict.copy() function to return
-            # a copy. The values are all Python "value types", so
-            # explicitly cloning the elements is not necessary to make
-            # a deep copy.
-
-            return _element_data[symbol].copy()
-        else:
-            return _element_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Elemental data for {0}"
-                  " not found.".format(symbol))
-            print(_element_data)
-        return None
+        copy (Optional(bool)) : ignored; retained for compatibility as
+            the cached record is immutable and returned directly.
 
+    Returns (ElementRecord): Data for given element, with fields (also
+        accessible as record['key']) named by the column headings of
+        data/element_data.txt.  The record behaves as a read-only dict of
+        its fields, which it replaces, but is also a named tuple.
+    """
 
-# Loader and cache for the element Shannon radii datasets.
+    return _default_store.lookup_element_data(symbol, copy)
 
-_element_shannon_radii_data = None
+# Element Shannon radii datasets.
 
 
 def lookup_element_shannon_radius_data(symbol, copy=True):
@@ -314,19 +1635,18 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
     Args:
         symbol (str) : the atomic symbol of the element to look up.
 
-        copy (Optional(bool)): if True (default), return a copy of the data
-        dictionary, rather than a reference to the cached object --
-        only use copy=False in performance-sensitive code and where
-        you are certain the dictionary will not be modified!
+        copy (Optional(bool)): ignored; retained for compatibility as
+            the cached records are immutable and returned directly.
 
     Returns:
-        list:
+        tuple:
             Shannon radii datasets.
 
         Returns None if the element was not found among the external
         data.
 
-        Shannon radii datasets are dictionaries with the keys:
+        Shannon radii datasets are ShannonRadiusRecord named tuples
+        with the fields (also accessible as record['key']):
 
         charge
             *int* charge
@@ -340,60 +1660,33 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
             *str*
     """
 
-    global _element_shannon_radii_data
-
-    if _element_shannon_radii_data is None:
-        _element_shannon_radii_data = {}
+    return _default_store.lookup_element_shannon_radius_data(symbol, copy)
 
-        with open(os.path.join(data_directory, "shannon_radii.csv"),
-                  'rU') as file:
-            reader = csv.reader(file)
 
-            # Skip the first row (headers).
-
-            next(reader)
-
-            for row in reader:
-                # For the shannon radii, there are multiple datasets for
-                # different element/oxidation-state/coordination
-                # combinations.
-
-                key = row[0]
-
-                dataset = {
-                    'charge': int(row[1]),
-                    'coordination': row[2],
-                    'crystal_radius': float(row[3]),
-                    'ionic_radius': float(row[4]),
-                    'comment': row[5]
-                    }
-
-                if key in _element_shannon_radii_data:
-                    _element_shannon_radii_data[key].append(dataset)
-                else:
-                    _element_shannon_radii_data[key] = [dataset]
+def lookup_species_shannon_radius_data(symbol, charge, coordination,
+                                       copy=True, nearest=False):
+    """
+    Retrieve the Shannon radii of an element in one chemical environment.
 
-    if symbol in _element_shannon_radii_data:
-        if copy:
-            # _element_shannon_radii_data stores a list of dictionaries
-            # -> if copy is set, copy the list and use the dict.copy()
-            # function on each element.
-            # The dictionary values are all Python "value types", so
-            # nothing further is required to make a deep copy.
-            return [item.copy() for item in
-                    _element_shannon_radii_data[symbol]]
-        else:
-            return _element_shannon_radii_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Shannon-radius data for element {0} not "
-                  "found.".format(symbol))
+    Args:
+        symbol (str) : the atomic symbol of the element to look up.
+        charge (int) : oxidation state of the species.
+        coordination (str) : coordination environment, e.g. '6_n'.
+        copy (Optional(bool)): ignored; retained for compatibility.
+        nearest (Optional(bool)): if there is no dataset for this
+            coordination, fall back to the species' dataset with the
+            closest number of neighbours (the lower on a tie).
 
-        return None
+    Returns:
+        ShannonRadiusRecord: Shannon radii dataset with the fields
+            described in :func:`lookup_element_shannon_radius_data`, or
+            None if the species was not found among the external data.
+    """
 
-# Loader and cache for the element solid-state energy (SSE) datasets.
+    return _default_store.lookup_species_shannon_radius_data(
+        symbol, charge, coordination, copy, nearest)
 
-_element_ssedata = None
+# Element solid-state energy (SSE) datasets.
 
 
 def lookup_element_sse_data(symbol):
@@ -407,44 +1700,13 @@ def lookup_element_sse_data(symbol):
         symbol : the atomic symbol of the element to look up.
 
     Returns:
-        A dictionary containing the SSE dataset for the element, or None
+        An SSERecord containing the SSE dataset for the element, or None
         if the element was not found among the external data.
     """
 
-    global _element_ssedata
+    return _default_store.lookup_element_sse_data(symbol)
 
-    if _element_ssedata is None:
-        _element_ssedata = {}
-
-        with open(os.path.join(data_directory,
-                               "SSE.csv"), 'rU') as file:
-            reader = csv.reader(file)
-
-            for row in reader:
-                dataset = {
-                    'AtomicNumber': int(row[1]),
-                    'SolidStateEnergy': float(row[2]),
-                    'IonisationPotential': float(row[3]),
-                    'ElectronAffinity': float(row[4]),
-                    'MullikenElectronegativity': float(row[5]),
-                    'SolidStateRenormalisationEnergy': float(row[6])
-                    }
-
-                _element_ssedata[row[0]] = dataset
-
-    if symbol in _element_ssedata:
-        return _element_ssedata[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Solid-state energy data for element {0} not"
-                  " found.".format(symbol))
-
-        return None
-
-# Loader and cache for the revised (2015) element solid-state energy
-# (SSE) datasets.
-
-_element_sse2015_data = None
+# Revised (2015) element solid-state energy (SSE) datasets.
 
 
 def lookup_element_sse2015_data(symbol, copy=True):
@@ -457,57 +1719,34 @@ def lookup_element_sse2015_data(symbol, copy=True):
 
     Args:
         symbol : the atomic symbol of the element to look up.
-        copy: if True (default), return a copy of the data dictionary,
-        rather than a reference to a cached object -- only use
-        copy=False in performance-sensitive code and where you are
-        certain the dictionary will not be modified!
+        copy: ignored; retained for compatibility as the cached
+        records are immutable and returned directly.
 
     Returns:
-        A list of SSE datasets for the element, or None if the element was
-        not found among the external data.
+        A tuple of SSE2015Record datasets for the element, or None if the
+        element was not found among the external data.
     """
 
-    global _element_sse2015_data
-
-    if _element_sse2015_data is None:
-        _element_sse2015_data = {}
-
-        with open(os.path.join(data_directory, "SSE_2015.csv"),
-                  'rU') as file:
-            reader = csv.reader(file)
-
-            for row in reader:
-                # Elements can have multiple SSE values depending on
-                # their oxidation state
-
-                key = row[0]
+    return _default_store.lookup_element_sse2015_data(symbol, copy)
 
-                dataset = {
-                    'OxidationState': int(row[1]),
-                    'SolidStateEnergy2015': float(row[2])}
 
-                if key in _element_sse2015_data:
-                    _element_sse2015_data[key].append(dataset)
-                else:
-                    _element_sse2015_data[key] = [dataset]
+def lookup_species_sse2015(symbol, oxidation):
+    """
+    Retrieve the SSE (2015) of an element in one oxidation state.
 
-    if symbol in _element_sse2015_data:
-        if copy:
-            return [item.copy() for item in
-                    _element_sse2015_data[symbol]]
-        else:
-            return _element_sse2015_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Solid-state energy (revised 2015) data for "
-                  "element {0} not found.".format(symbol))
+    Args:
+        symbol (str) : the atomic symbol of the element to look up.
+        oxidation (int) : oxidation state of the species.
 
-        return None
+    Returns:
+        float: Solid-state energy, or None if the species was not found
+            among the external data.
+    """
 
-# Loader and cache for the element solid-state energy (SSE) from Pauling
-# electronegativity datasets.
+    return _default_store.lookup_species_sse2015(symbol, oxidation)
 
-_element_ssepauling_data = None
+# Element solid-state energy (SSE) from Pauling electronegativity
+# datasets.
 
 
 def lookup_element_sse_pauling_data(symbol):
@@ -521,32 +1760,106 @@ def lookup_element_sse_pauling_data(symbol):
     Args:
     symbol (str) : the atomic symbol of the element to look up.
 
-    Returns: A dictionary containing the SSE2015 dataset for the
+    Returns: An SSEPaulingRecord containing the SSE2015 dataset for the
         element, or None if the element was not found among the external
         data.
     """
 
-    global _element_ssepauling_data
+    return _default_store.lookup_element_sse_pauling_data(symbol)
 
-    if _element_ssepauling_data is None:
-        _element_ssepauling_data = {}
+# Bulk lookups returning NumPy arrays.
 
-        with open(os.path.join(data_directory, "SSE_Pauling.csv"),
-                  'rU') as file:
-            reader = csv.reader(file)
 
-            for row in reader:
-                dataset = {
-                    'SolidStateEnergyPauling': float(row[1])}
+def lookup_atomic_numbers(elements):
+    """
+    Retrieve the proton numbers of many elements at once.
 
-                _element_ssepauling_data[row[0]] = dataset
+    Args:
+        elements (sequence) : element symbols, or proton numbers to be
+            validated.
 
-    if symbol in _element_ssepauling_data:
-        return _element_ssepauling_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Solid-state energy data from Pauling "
-                  " electronegativity regression fit for "
-                  " element {0} not found.".format(symbol))
+    Returns:
+        numpy.ndarray: Integer proton numbers, with 0 in place of any
+            unrecognised symbol or out-of-range number.
+    """
 
-        return None
+    return _default_store.lookup_atomic_numbers(elements)
+
+
+def lookup_many(prop, elements):
+    """
+    Retrieve one property of many elements as an array.
+
+    Args:
+        prop (str) : name of the :class:`smact.Element` attribute, one of
+            covalent_radius, crustal_abundance, e_affinity, eig, eig_s,
+            ionpot, mass, pauling_eneg, HHI_p, HHI_r, SSE or SSEPauling.
+        elements (sequence) : element symbols or proton numbers.
+
+    Returns:
+        numpy.ndarray: Float values in the order of ``elements``, NaN
+            where the element or its value is unknown.
+    """
+
+    return _default_store.lookup_many(prop, elements)
+
+
+def lookup_oxidation_states_many(elements, oxidation_states_set='default'):
+    """
+    Retrieve the oxidation states of many elements as arrays.
+
+    The result is in compressed sparse row (CSR) form: the oxidation
+    states of ``elements[i]`` are ``values[offsets[i]:offsets[i + 1]]``.
+
+    Args:
+        elements (sequence) : element symbols or proton numbers.
+        oxidation_states_set (str) : name of the oxidation-state set,
+            see :func:`oxidation_state_sets`.
+
+    Returns:
+        tuple: (offsets, values) integer arrays; offsets has one more
+            entry than ``elements``.  Unknown elements have no states.
+    """
+
+    return _default_store.lookup_oxidation_states_many(
+        elements, oxidation_states_set)
+
+
+def lookup_shannon_radii_many(elements=None, charges=None,
+                              coordinations=None):
+    """
+    Retrieve the Shannon radii of all species matching a query.
+
+    Each argument restricts the result to species with any of the
+    given values of that field; e.g. every six-fold coordinated
+    trivalent or tetravalent cation is
+    ``lookup_shannon_radii_many(charges=[3, 4], coordinations=['6_n'])``.
+
+    Args:
+        elements (Optional(sequence)) : element symbols or proton numbers.
+        charges (Optional(sequence)) : oxidation states.
+        coordinations (Optional(sequence)) : coordination environments,
+            e.g. '6_n'.
+
+    Returns:
+        numpy.ndarray: Structured array with one entry per matching row
+            of shannon_radii.csv, in file order, and the fields symbol,
+            number, charge, coordination, coordination_number,
+            crystal_radius and ionic_radius (see SHANNON_RADII_DTYPE).
+    """
+
+    return _default_store.lookup_shannon_radii_many(elements, charges,
+                                                    coordinations)
+
+# Instrumentation.
+
+
+def stats():
+    """
+    Snapshot of the default store's load timings and lookup counts.
+
+    Returns:
+        dict: see :meth:`DataStore.stats`.
+    """
+
+    return _default_store.stats()
@@ -15,7 +15,6 @@
 # this program.  If not, see <http://www.gnu.org/licenses/>.                   #
 ################################################################################
 
-from builtins import object
 import numpy as np
 import smact
 
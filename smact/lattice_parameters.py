@@ -18,7 +18,6 @@
 ################################################################################
 
 from __future__ import division
-from past.utils import old_div
 import numpy as np
 
 def cubic_perovskite(shannon_radius): #Cubic Pervoskite
@@ -62,7 +61,7 @@ def wurtzite(shannon_radius):
     if shannon_radius[0] > 0.817*(shannon_radius[0]+shannon_radius[1]):
         a = 2 * shannon_radius[0]
         b = a
-        c = 2 * np.sqrt(old_div(2.,3.)) * a
+        c = 2 * np.sqrt(2./3.) * a
     else:
         # Scenario B: regular wurtzite, similar sizes
         a = 2*0.817*(shannon_radius[0]+shannon_radius[1])  # 0.817 is sin(109.6/2)
@@ -116,7 +115,7 @@ def hcp(covalent_radius):
     '''
     a = 2 * covalent_radius
     b = a
-    c = (old_div(4.,3.)) * 6**0.5 * covalent_radius
+    c = (4./3.) * 6**0.5 * covalent_radius
     alpha = 90
     beta = 90
     gamma = 120
@@ -201,7 +200,7 @@ def zincblende(shannon_radius):
 	a,b,c : real number values of the lattice constants
 	alpha,beta,gamma : real number values of the lattice angles
     '''
-    limiting_factors=[2*(max(shannon_radius)*np.sqrt(2)), 4*(shannon_radius[0] + shannon_radius[1])**(old_div(1.,3.))]
+    limiting_factors=[2*(max(shannon_radius)*np.sqrt(2)), 4*(shannon_radius[0] + shannon_radius[1])**(1./3.)]
     a = max(limiting_factors)
     b = a
     c = a
@@ -0,0 +1,246 @@
+###############################################################################
+# Copyright Daniel Davies, Adam J. Jackson, Keith T. Butler (2016)            #
+#                                                                             #
+# This file is part of SMACT: parallel.py is free software: you can           #
+# redistribute it and/or modify it under the terms of the GNU General Public  #
+# License as published by the Free Software Foundation, either version 3 of   #
+# the License, or (at your option) any later version.  This program is        #
+# distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;   #
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A       #
+# PARTICULAR PURPOSE.  See the GNU General Public License for more details.   #
+# You should have received a copy of the GNU General Public License along     #
+# with this program.  If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+###############################################################################
+
+"""
+Share read-only lookup tables between worker processes.
+
+Screening over element combinations parallelises well, but sending
+Element objects and lookup dictionaries with every task (and having
+each worker re-parse the data files) dominates the cost.  Instead, the
+parent publishes the tables once as NumPy arrays in
+:mod:`multiprocessing.shared_memory`, passes the small picklable
+:attr:`SharedArrays.spec` to :func:`init_worker` as the Pool
+initializer, and tasks carry only integer indices into the tables, e.g.::
+
+    tables = parallel.element_tables(symbols, max_n=4)
+    with parallel.SharedArrays(tables) as shared:
+        pool = Pool(initializer=parallel.init_worker,
+                    initargs=(shared.spec,))
+        ...
+
+Inside a task, :func:`worker_arrays` returns zero-copy, read-only views
+of the published arrays.
+"""
+
+import itertools
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from smact import data_loader, neutral_ratios
+
+
+class SharedArrays(object):
+    """
+    NumPy arrays published in shared-memory blocks.
+
+    The publishing process owns the blocks and must release them with
+    :meth:`close` (or by using the object as a context manager) once
+    all workers have finished.
+
+    Attributes:
+        SharedArrays.spec (dict): Picklable description of the blocks,
+            keyed by array name, to be passed to :func:`attach_arrays`.
+
+    Args:
+        arrays (dict): NumPy arrays keyed by name.
+    """
+
+    def __init__(self, arrays):
+        self.spec = {}
+        self._blocks = []
+
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                # Zero-size blocks are not allowed
+                block = shared_memory.SharedMemory(
+                    create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype,
+                           buffer=block.buf)[...] = array
+                self.spec[name] = (block.name, array.shape, array.dtype.str)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """Release and unlink the shared-memory blocks."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Blocks attached by this process, each with a weak reference to the
+# array viewing it; a block is kept open for as long as that array (or
+# any view of it, which refers to it as its base) may be used.
+_attached_blocks = []
+_worker_arrays = None
+
+
+def attach_arrays(spec):
+    """
+    Attach to arrays published by :class:`SharedArrays`.
+
+    Args:
+        spec (dict): The :attr:`SharedArrays.spec` of the publisher.
+
+    Returns:
+        dict: Read-only NumPy views of the shared arrays, keyed by name.
+    """
+
+    arrays = {}
+    for name, (block_name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array.setflags(write=False)
+        _attached_blocks.append((block, weakref.ref(array)))
+        arrays[name] = array
+    return arrays
+
+
+def detach_arrays():
+    """
+    Release the blocks attached by :func:`attach_arrays` in this process.
+
+    The arrays returned by :func:`worker_arrays` are dropped first.  A
+    block whose array (or a view of it) is still referenced elsewhere
+    cannot be closed safely; it stays attached and is released by a
+    later call once those references are gone.
+
+    Returns:
+        int: Number of blocks still attached.
+    """
+
+    global _worker_arrays
+    _worker_arrays = None
+
+    in_use = []
+    for block, array in _attached_blocks:
+        if array() is None:
+            block.close()
+        else:
+            in_use.append((block, array))
+    _attached_blocks[:] = in_use
+    return len(in_use)
+
+
+def init_worker(spec):
+    """
+    Pool initializer attaching a worker to published arrays.
+
+    Any arrays the process attached before are detached first.
+
+    Args:
+        spec (dict): The :attr:`SharedArrays.spec` of the publisher.
+    """
+
+    global _worker_arrays
+    detach_arrays()
+    _worker_arrays = attach_arrays(spec)
+
+
+def worker_arrays():
+    """
+    Retrieve the arrays attached by :func:`init_worker`.
+
+    Returns:
+        dict: Read-only NumPy arrays keyed by name, or None if this
+            process was not initialised with :func:`init_worker`.
+    """
+
+    return _worker_arrays
+
+
+def neutral_stoichiometry_counts(oxidation_states, n, threshold=8):
+    """
+    Tabulate charge-neutral stoichiometries of oxidation-state sets.
+
+    Args:
+        oxidation_states (sequence): Distinct oxidation states, sorted in
+            ascending order.
+        n (int): Number of sites.
+        threshold (int): Maximum stoichiometry, as for
+            :func:`smact.neutral_ratios`.
+
+    Returns:
+        numpy.ndarray: n-dimensional integer array; the entry at a
+            non-decreasing tuple of indices into oxidation_states is the
+            number of neutral stoichiometries of those states.  Other
+            entries are zero, so look up with sorted indices.
+    """
+
+    oxidation_states = list(oxidation_states)
+    counts = np.zeros((len(oxidation_states),) * n, dtype=np.int64)
+
+    for index in itertools.combinations_with_replacement(
+            range(len(oxidation_states)), n):
+        states = [oxidation_states[i] for i in index]
+        counts[index] = len(neutral_ratios(states, threshold=threshold)[1])
+    return counts
+
+
+def element_tables(symbols, max_n=4, threshold=8,
+                   oxidation_states_set='default'):
+    """
+    Build the lookup tables needed to screen combinations of elements.
+
+    Elements are referred to by their index in ``symbols``.
+
+    Args:
+        symbols (sequence): Element symbols.
+        max_n (int): Largest number of sites for which neutral
+            stoichiometries are tabulated.
+        threshold (int): Maximum stoichiometry.
+        oxidation_states_set (str): Name of the oxidation-state set, see
+            :func:`smact.data_loader.oxidation_state_sets`.
+
+    Returns:
+        dict: NumPy arrays, with keys
+
+        pauling_eneg
+            *float* electronegativity of each element (NaN if unknown)
+        oxidation_state_offsets, oxidation_state_values
+            *int* oxidation states of each element in CSR form
+        oxidation_states
+            *int* sorted distinct oxidation states of all the elements
+        neutral_counts_<n>
+            *int* :func:`neutral_stoichiometry_counts` of those states,
+            for n = 2 ... max_n
+    """
+
+    numbers = data_loader.lookup_atomic_numbers(symbols)
+    offsets, values = data_loader.lookup_oxidation_states_many(
+        numbers, oxidation_states_set)
+    states = np.unique(values)
+
+    tables = {'pauling_eneg': data_loader.lookup_many('pauling_eneg',
+                                                      numbers),
+              'oxidation_state_offsets': offsets,
+              'oxidation_state_values': values,
+              'oxidation_states': states}
+    for n in range(2, max_n + 1):
+        tables['neutral_counts_{0}'.format(n)] = \
+            neutral_stoichiometry_counts(states.tolist(), n,
+                                         threshold=threshold)
+    return tables
@@ -13,11 +13,19 @@
 #                                                                             #
 ###############################################################################
 
-from builtins import zip
 from itertools import combinations
-from smact import Element, neutral_ratios
+from functools import lru_cache
+from collections import Counter, deque
+import os
+from smact import Element, neutral_ratios, data_loader
 import itertools
 
+# NumPy, multiprocessing and smact.parallel are imported inside the
+# functions which use them, so that importing this module stays fast.
+
+# Number of elements, and so the length of the ml_rep_generator vector
+_ML_REP_LENGTH = 103
+
 def pauling_test(oxidation_states, electronegativities,
                  symbols=[], repeat_anions=True,
                  repeat_cations=True, threshold=0.):
@@ -249,13 +257,72 @@ def eneg_states_test_alternate(ox_states, enegs):
             max_anion_eneg = max(eneg, max_anion_eneg)
     return min_cation_eneg > max_anion_eneg
 
+def eneg_states_mask(ox_states, enegs, threshold=0.):
+    """Electronegativity criterion for many candidates at once
+
+    The criterion of :func:`eneg_states_test` (or
+    :func:`eneg_states_test_threshold` for a non-zero threshold),
+    evaluated for every row in one vectorised pass: a candidate passes
+    if its most electronegative cation is less electronegative than its
+    least electronegative anion (by more than -threshold).  Candidates
+    with fewer sites can be padded with oxidation state 0, as neutral
+    sites are ignored.
+
+    Missing electronegativities are treated as in eneg_states_test,
+    which tells None and NaN apart: a NaN fails every comparison, so it
+    never makes a candidate fail, while a None fails the test without a
+    threshold (for candidates of two or more sites) and is ignored with
+    one.  So e.g. ([2, -1], [nan, 2.]) passes and ([0, 1, -1],
+    [None, 1., 2.]) fails.  Unlike eneg_states_test, a None is never
+    compared, so no TypeError is raised.
+
+    Args:
+        ox_states (array-like): oxidation states, one row per candidate
+            and one column per site
+        enegs (array-like): the corresponding electronegativities; a
+            single row is used for every candidate
+        threshold (float): a tolerance for the allowed deviation from
+            the Pauling criterion
+
+    Returns:
+        numpy.ndarray : boolean mask, True for the candidates whose
+            cations are less electronegative than their anions
+
+    """
+    import numpy as np
+    enegs = np.asarray(enegs)
+    if enegs.dtype == object:
+        # Tell None from NaN before both become NaN in the cast
+        none = np.equal(enegs, None)
+        enegs = np.where(none, np.nan, enegs).astype(float)
+    else:
+        none = np.zeros(enegs.shape, dtype=bool)
+    ox_states, enegs, none = np.broadcast_arrays(
+        np.asarray(ox_states), enegs, none)
+    missing = np.isnan(enegs)
+    cations = (ox_states > 0) & ~missing
+    anions = (ox_states < 0) & ~missing
+
+    max_cation_eneg = np.where(cations, enegs, -np.inf).max(
+        axis=-1, initial=-np.inf)
+    min_anion_eneg = np.where(anions, enegs, np.inf).min(
+        axis=-1, initial=np.inf)
+
+    if threshold == 0.:
+        return ((max_cation_eneg < min_anion_eneg)
+                & ~(none.any(axis=-1) & (ox_states.shape[-1] > 1)))
+    else:
+        return max_cation_eneg - min_anion_eneg <= threshold
+
 def ml_rep_generator(composition, stoichs=None):
     """Function to take a composition of Elements and returns a
     list of values between 0 and 1 that describes the composition,
     useful for machine learning.
 
     The list is of length 103 as there are 103 elements
-    considered in total in SMACT.
+    considered in total in SMACT.  In SMACT 1.2 and earlier it had only
+    102 entries, leaving out Lr; to use vectors with a model trained on
+    those, drop the last entry.
 
     e.g. Li2O --> [0, 0, 2/3, 0, 0, 0, 0, 1/3, 0 ....]
 
@@ -270,21 +337,217 @@ def ml_rep_generator(composition, stoichs=None):
             to one
 
     """
-    if stoichs == None:
-        stoichs = [1 for i, el in enumerate(composition)]
+    return ml_rep_batch([(composition, stoichs)],
+                        dtype='float64')[0].tolist()
+
+def _ml_rep_matrix(compositions, sparse, dtype):
+    """ml_rep_generator vectors of a list of compositions, one per row"""
+    import numpy as np
+    symbols, stoichs, indptr = [], [], [0]
+    for elements, ratio in compositions:
+        symbols.extend(el.symbol if isinstance(el, Element) else el
+                       for el in elements)
+        stoichs.extend([1] * len(elements) if ratio is None else ratio)
+        indptr.append(len(symbols))
+
+    columns = data_loader.lookup_atomic_numbers(symbols) - 1
+    unknown = (columns < 0) | (columns >= _ML_REP_LENGTH)
+    if unknown.any():
+        raise NameError("Elemental data for {0} not found.".format(
+            symbols[int(np.argmax(unknown))]))
+
+    # Normalise each stoichiometry by the total of its composition
+    indptr = np.array(indptr)
+    rows = np.repeat(np.arange(len(compositions)), np.diff(indptr))
+    stoichs = np.array(stoichs, dtype=np.float64)
+    totals = np.bincount(rows, weights=stoichs, minlength=len(compositions))
+    values = (stoichs / totals[rows]).astype(dtype)
+
+    shape = (len(compositions), _ML_REP_LENGTH)
+    if sparse:
+        from scipy.sparse import csr_matrix
+        matrix = csr_matrix((values, columns, indptr), shape=shape)
+        matrix.sum_duplicates()
+    else:
+        matrix = np.zeros(shape, dtype=dtype)
+        np.add.at(matrix, (rows, columns), values)
+    return matrix
+
+def ml_rep_batch(compositions, sparse=False, dtype='float32'):
+    """Machine-learning representations of many compositions at once.
+
+    Each row is the :func:`ml_rep_generator` vector of a composition,
+    but the compositions are featurised together: symbols are resolved
+    to atomic numbers through the cached index of the data store rather
+    than by building Element objects.  For datasets too large to hold in
+    memory, see :func:`ml_rep_chunks`.
+
+    Args:
+        compositions (iterable): (elements, stoichs) pairs, e.g. as
+            returned by smact_test, where elements are Element objects or
+            symbols and stoichs may be None for one of each element.
+        sparse (bool): Return a scipy.sparse CSR matrix rather than a
+            dense array; most entries are zero.
+        dtype (numpy.dtype): Type of the values, default float32.
+
+    Returns:
+        matrix (numpy.ndarray or scipy.sparse.csr_matrix): Array of shape
+            (number of compositions, 103) whose rows sum to one; see
+            ml_rep_generator for the change from 102 columns.
+    """
+    return _ml_rep_matrix(list(compositions), sparse, dtype)
+
+def ml_rep_chunks(compositions, chunksize=65536, sparse=False,
+                  dtype='float32'):
+    """Machine-learning representations of compositions, in chunks.
 
-    ML_rep = [0 for i in range(1,103)]
-    if type(composition[0]) == Element:
-        for element, stoich in zip(composition, stoichs):
-            ML_rep[int(element.number)-1] += stoich
+    Like :func:`ml_rep_batch`, but the compositions are consumed lazily
+    and featurised chunksize at a time, so e.g. the output of
+    :func:`screen_space` can be written to disk chunk by chunk without
+    holding all of it in memory.
+
+    Args:
+        compositions (iterable): (elements, stoichs) pairs, as for
+            ml_rep_batch.
+        chunksize (int): Maximum number of rows in each matrix.
+        sparse (bool): Yield scipy.sparse CSR matrices rather than dense
+            arrays.
+        dtype (numpy.dtype): Type of the values, default float32.
+
+    Yields:
+        matrix (numpy.ndarray or scipy.sparse.csr_matrix): Representations
+            of the next chunksize (or fewer) compositions.
+    """
+    for chunk in _chunks(compositions, chunksize):
+        yield _ml_rep_matrix(chunk, sparse, dtype)
+
+def oxidation_state_products(ox_combos, threshold=8):
+    """Combinations of oxidation states, one per site, that may be neutral
+
+    Equivalent to ``itertools.product(*ox_combos)`` (in the same order)
+    without the combinations that can never be charge neutral with
+    stoichiometries of 1 to threshold: e.g. those with only cations or
+    only anions, or +1 with -4 at threshold 2.  The product is
+    enumerated depth-first, and a partial combination is abandoned as
+    soon as the range of total charge it could still reach, given the
+    states left for the remaining sites, excludes zero, so hopeless
+    combinations are never generated.
+
+    Args:
+        ox_combos (list): Allowed oxidation states of each site.
+        threshold (int): Maximum stoichiometry of each site.
+
+    Yields:
+        tuple: Oxidation states, one per site, for which
+            :func:`smact.neutral_ratios` may find neutral ratios.
+    """
+    # Range of charge contributed by 1 to threshold ions in each state
+    ox_combos = [[(state, min(state, threshold * state),
+                   max(state, threshold * state)) for state in states]
+                 for states in ox_combos]
+    if not all(ox_combos):
+        return
+
+    # Range of charge reachable by all the sites after each one
+    min_rest, max_rest = [0], [0]
+    for states in reversed(ox_combos[1:]):
+        min_rest.insert(0, min_rest[0] + min(lo for _, lo, _ in states))
+        max_rest.insert(0, max_rest[0] + max(hi for _, _, hi in states))
+
+    def extend(ox_states, min_charge, max_charge):
+        site = len(ox_states)
+        if site == len(ox_combos):
+            yield ox_states
+            return
+        for state, lo, hi in ox_combos[site]:
+            if (min_charge + lo + min_rest[site] <= 0
+                    <= max_charge + hi + max_rest[site]):
+                yield from extend(ox_states + (state,),
+                                  min_charge + lo, max_charge + hi)
+
+    yield from extend((), 0, 0)
+
+# Only the oxidation states are cached, not their ratios: those are
+# memoised by neutral_ratios, and keeping them per element set would pin
+# most of a megabyte for each quaternary.
+@lru_cache(maxsize=256)
+def _neutral_states(symbols, threshold, oxidation_states_set, generations):
+    """Cached candidate oxidation states of neutral_combinations"""
+    ox_combos = [data_loader.lookup_oxidation_state_set(
+                     symbol, oxidation_states_set) or ()
+                 for symbol in symbols]
+    return tuple(oxidation_state_products(ox_combos, threshold))
+
+# Number of times the data of each element has changed (see
+# smact.data_loader.add_overlay).  The counts are part of the cache key
+# of neutral_combinations(), so cached states for changed elements are
+# never returned again, while those for other elements stay valid.
+_data_generations = {}
+
+
+def _count_data_changes(event):
+    """Event hook recording the elements whose data has changed"""
+
+    if event['event'] != 'data_changed':
+        return
+    store = data_loader.get_default_store()
+    if event.get('store', store) is not store:
+        return
+
+    if event['symbols'] is None:
+        _neutral_states.cache_clear()
     else:
-        for element, stoich in zip(composition, stoichs):
-            ML_rep[int(Element(element).number)-1] += stoich
+        for symbol in event['symbols']:
+            _data_generations[symbol] = _data_generations.get(symbol, 0) + 1
+
+data_loader.add_event_hook(_count_data_changes)
+
+def neutral_combinations(symbols, threshold=8, oxidation_states_set='default'):
+    """Charge-neutral combinations of oxidation states for a set of elements.
+
+    The neutral combinations of states are cached separately for every
+    oxidation-state set, so repeated screening of the same elements
+    (e.g. with different electronegativity criteria) only enumerates
+    the states once.
+
+    Args:
+        symbols (tuple): Chemical symbols, one per site.
+        threshold (int): Threshold for stoichiometry limit, default = 8.
+        oxidation_states_set (str): Name of the oxidation-state set, see
+            :func:`smact.data_loader.oxidation_state_sets`.
+
+    Returns:
+        tuple: (oxidation_states, ratios) pairs for each combination of
+            oxidation states with at least one neutral ratio.
+    """
+    symbols = tuple(symbols)
+    combinations = []
+    for ox_states in _neutral_states(
+            symbols, threshold, oxidation_states_set,
+            tuple(_data_generations.get(symbol, 0) for symbol in symbols)):
+        cn_e, cn_r = neutral_ratios(ox_states, threshold=threshold)
+        if cn_e:
+            combinations.append((ox_states, tuple(cn_r)))
+    return tuple(combinations)
+
+def _symbols_and_enegs(els, include):
+    """Symbols and Pauling electronegativities of the elements to test"""
+    els = list(els)
+    els = els + include if include != None else els
+    els = [Element(e) if isinstance(e, str) else e for e in els]
+    return [e.symbol for e in els], [e.pauling_eneg for e in els]
+
+def _eneg_allowed(ox_states, electronegs):
+    """pauling_test of each combination of oxidation states
 
-    norm = [float(i)/sum(ML_rep) for i in ML_rep]
-    return norm
+    The combinations are tested at once with eneg_states_mask, unless an
+    electronegativity is missing, where pauling_test may raise instead.
+    """
+    if any(eneg is None for eneg in electronegs):
+        return [pauling_test(states, electronegs) for states in ox_states]
+    return eneg_states_mask(ox_states, electronegs)
 
-def smact_test(els, threshold=8, include=None):
+def smact_test(els, threshold=8, include=None, oxidation_states_set='default'):
     """Function that applies the charge neutrality and electronegativity
     tests in one go for simple application in external scripts that
     wish to apply the general 'smact test'.
@@ -293,6 +556,9 @@ def smact_test(els, threshold=8, include=None):
         els (tuple): A list of Element objects or symbols.
         threshold (int): Threshold for stoichiometry limit, default = 8.
         include (list): (optional) List of Element objects that must be in every composition.
+        oxidation_states_set (str): Name of the oxidation-state set to
+            use, e.g. 'default' (the most exhaustive) or 'icsd', see
+            :func:`smact.data_loader.oxidation_state_sets`.
     Returns:
         allowed_comps (list): Allowed compositions for that chemical system
         in the form [[elements], [ratios]]
@@ -300,23 +566,309 @@ def smact_test(els, threshold=8, include=None):
     Note: Info on oxidation states is not returned, only the list of elements and unique allowed ratios.
     """
     ratios = []
-    els = list(els)
-    els = els + include if include != None else els
-
-    # Get symbols and electronegativities
-    symbols = [e.symbol for e in els]
-    electronegs = [e.pauling_eneg for e in els]
-    ox_combos = [e.oxidation_states for e in els]
-
-    for ox_states in itertools.product(*ox_combos):
-        # Test for charge balance
-        cn_e, cn_r = neutral_ratios(ox_states, threshold=threshold)
-        # Electronegativity test
-        if cn_e:
-            electroneg_OK = pauling_test(ox_states, electronegs)
-            if electroneg_OK:
-                ratios.append(cn_r)
+    symbols, electronegs = _symbols_and_enegs(els, include)
+
+    combinations = neutral_combinations(
+        tuple(symbols), threshold, oxidation_states_set)
+    if combinations:
+        # Electronegativity test of all the combinations at once
+        allowed = _eneg_allowed(
+            [ox_states for ox_states, cn_r in combinations], electronegs)
+        ratios = [cn_r for (ox_states, cn_r), ok
+                  in zip(combinations, allowed) if ok]
     ratios = [item for sublist in ratios for item in sublist]
     ratios = list(set(ratios))
     compositions = [[symbols,x] for x in ratios]
     return compositions
+
+def smact_test_iter(els, threshold=8, include=None,
+                    oxidation_states_set='default', chunksize=1024):
+    """Generator variant of :func:`smact_test`.
+
+    Compositions are yielded as soon as they are found, rather than
+    collected into a list, so they can be filtered or written out
+    without holding every intermediate ratio in memory.  Combinations
+    of oxidation states that may be neutral (see
+    :func:`oxidation_state_products`) are enumerated lazily and tested
+    for electronegativity in chunks, and charge neutrality is only solved
+    for the combinations that pass.  Only the ratios already yielded
+    are kept, to skip repeats.
+
+    The compositions are the same as those of smact_test, but not
+    necessarily in the same order.
+
+    Args:
+        els (tuple): A list of Element objects or symbols.
+        threshold (int): Threshold for stoichiometry limit, default = 8.
+        include (list): (optional) List of Element objects that must be in every composition.
+        oxidation_states_set (str): Name of the oxidation-state set, see
+            :func:`smact.data_loader.oxidation_state_sets`.
+        chunksize (int): Number of combinations of oxidation states to
+            test for electronegativity at once.
+
+    Yields:
+        list: Allowed compositions in the form [elements, ratio]
+    """
+    symbols, electronegs = _symbols_and_enegs(els, include)
+    ox_combos = [data_loader.lookup_oxidation_state_set(
+                     symbol, oxidation_states_set) or ()
+                 for symbol in symbols]
+
+    seen = set()
+    products = oxidation_state_products(ox_combos, threshold)
+    while True:
+        chunk = list(itertools.islice(products, chunksize))
+        if not chunk:
+            return
+        allowed = _eneg_allowed(chunk, electronegs)
+        for ox_states, ok in zip(chunk, allowed):
+            if not ok:
+                continue
+            cn_e, cn_r = neutral_ratios(ox_states, threshold=threshold)
+            for ratio in cn_r:
+                if ratio not in seen:
+                    seen.add(ratio)
+                    yield [symbols, ratio]
+
+def _bounded_imap(function, tasks, processes, initializer=None, initargs=()):
+    """Map a function over tasks in a process pool, in order
+
+    Unlike Pool.imap, which submits every task up front, only two tasks
+    per process are in flight at once, so tasks are consumed lazily.
+    """
+    from multiprocessing import Pool
+    processes = processes or os.cpu_count() or 1
+    with Pool(processes, initializer, initargs) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(function, (task,)))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+def _chunks(iterable, chunksize):
+    """Lists of up to chunksize consecutive items of an iterable"""
+    iterator = iter(iterable)
+    return iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+
+def _screen_chunk(args):
+    """Worker function of screen_space: smact_test a list of element sets"""
+    element_sets, threshold, include, oxidation_states_set = args
+    return [composition for els in element_sets
+            for composition in smact_test(
+                els, threshold=threshold, include=include,
+                oxidation_states_set=oxidation_states_set)]
+
+def screen_space(elements, order, threshold=8, include=None, processes=None,
+                 chunksize=64, oxidation_states_set='default'):
+    """Apply the smact test to every combination of elements in a space.
+
+    Combinations of ``order`` elements are enumerated lazily and sent in
+    chunks to a pool of worker processes, each applying
+    :func:`smact_test`.  Only a few chunks per process are in flight at
+    once, so even quaternary spaces are never held in memory, and the
+    compositions are yielded in the order of the combinations as soon
+    as each chunk is done.  Aggregate them with e.g. ``list()``.
+
+    Args:
+        elements (list): Element objects or symbols to combine.
+        order (int): Number of elements in each combination (not counting
+            those in include), e.g. 3 for ternaries.
+        threshold (int): Threshold for stoichiometry limit, default = 8.
+        include (list): (optional) Element objects or symbols that must be
+            in every composition.
+        processes (int): Number of worker processes; defaults to the
+            number of CPUs.  With 1, the space is screened in this process.
+        chunksize (int): Number of element combinations sent to a worker
+            at a time.
+        oxidation_states_set (str): Name of the oxidation-state set, see
+            :func:`smact.data_loader.oxidation_state_sets`.
+
+    Yields:
+        list: Allowed compositions in the form [elements, ratio], as
+            returned by smact_test.
+    """
+    symbols = [e if isinstance(e, str) else e.symbol for e in elements]
+    if include is not None:
+        include = [e if isinstance(e, str) else e.symbol for e in include]
+
+    tasks = ((chunk, threshold, include, oxidation_states_set)
+             for chunk in _chunks(itertools.combinations(symbols, order),
+                                  chunksize))
+
+    if processes == 1:
+        results = map(_screen_chunk, tasks)
+    else:
+        results = _bounded_imap(_screen_chunk, tasks, processes)
+    for compositions in results:
+        yield from compositions
+
+def _count_combinations(tables, order, element_sets, species=False):
+    """Count the neutral stoichiometries of sets of element indices
+
+    With species, every combination of order distinct species (element
+    and oxidation state) of each set is counted, rather than every
+    combination of one oxidation state per element.
+
+    Returns:
+        (order, counts): counts is an integer array with a row for each
+            stage ('neutral', 'electronegativity') and a column for each
+            element as the anion, plus a last column for no anion.
+    """
+    import numpy as np
+    offsets = tables['oxidation_state_offsets']
+    values = tables['oxidation_state_values']
+    enegs = tables['pauling_eneg']
+    neutral_counts = tables['neutral_counts_{0}'.format(order)]
+    # Index of each value among the distinct oxidation states
+    state_indices = np.searchsorted(tables['oxidation_states'], values)
+
+    counts = np.zeros((2, len(enegs) + 1), dtype=np.int64)
+    for elements in element_sets:
+        ranges = [np.arange(offsets[e], offsets[e + 1]) for e in elements]
+        if species:
+            # Every combination of order species, one per row
+            owners = np.repeat(elements, [len(r) for r in ranges])
+            choices = np.array(list(combinations(range(len(owners)),
+                                                 order)),
+                               dtype=np.intp).reshape(-1, order)
+            positions = np.concatenate(ranges)[choices]
+            owners = owners[choices]
+        else:
+            if not all(len(states) for states in ranges):
+                continue
+            # Every combination of oxidation states, one per row
+            positions = np.stack(np.meshgrid(*ranges, indexing='ij'),
+                                 axis=-1).reshape(-1, order)
+            owners = np.broadcast_to(np.asarray(elements), positions.shape)
+        if not len(positions):
+            continue
+        n_ratios = neutral_counts[tuple(np.sort(state_indices[positions],
+                                                axis=1).T)]
+        neutral = n_ratios > 0
+        if not neutral.any():
+            continue
+        ox_states = values[positions[neutral]]
+        owners = owners[neutral]
+        n_ratios = n_ratios[neutral]
+
+        # The anion is the most electronegative element in a negative state
+        site_enegs = enegs[owners]
+        anion_enegs = np.where(ox_states < 0,
+                               np.nan_to_num(site_enegs, nan=-1.),
+                               -np.inf)
+        anions = np.take_along_axis(
+            owners, anion_enegs.argmax(axis=1)[:, None], axis=1)[:, 0]
+        anions[~(ox_states < 0).any(axis=1)] = len(enegs)
+
+        counts[0] += np.bincount(anions, weights=n_ratios,
+                                 minlength=counts.shape[1]).astype(np.int64)
+        # Missing electronegativities are NaN in the tables but None in
+        # smact.Element, where they fail the test
+        passed = eneg_states_mask(
+            ox_states, np.where(np.isnan(site_enegs), None, site_enegs))
+        counts[1] += np.bincount(anions[passed], weights=n_ratios[passed],
+                                 minlength=counts.shape[1]).astype(np.int64)
+    return order, counts
+
+def _count_chunk(args):
+    """Worker function of count_space, reading the shared tables"""
+    from smact import parallel
+    return _count_combinations(parallel.worker_arrays(), *args)
+
+def count_space(elements, orders, threshold=8, processes=None,
+                chunksize=256, oxidation_states_set='default',
+                mode='elements'):
+    """Count the compositions passing the smact test in a space.
+
+    Like :func:`screen_space`, but only the numbers of charge-neutral
+    stoichiometries are accumulated, so memory use does not grow with
+    the number of compositions.  A stoichiometry is a combination of one
+    oxidation state per element with a neutral ratio of them, as
+    counted before the de-duplication of ratios in smact_test; they are
+    tallied from tables of the number of neutral ratios of each sorted
+    multiset of oxidation states, shared with the worker processes.
+
+    With ``mode='species'``, the count is instead the one originally
+    made by examples/Counting/ElementCombinationsParallel.py:
+    for an order n, every combination of n distinct species (an element
+    in one of its oxidation states) drawn from each combination of 2 to
+    n elements, so mixed-valence stoichiometries such as those of
+    Fe(II)/Fe(III)/O are included.  As there, a combination of species
+    is counted once for every element combination containing its
+    elements.
+
+    Args:
+        elements (list): Element objects or symbols to combine.
+        orders (int or list): Number(s) of elements in each combination,
+            e.g. [2, 3, 4] for binaries to quaternaries.
+        threshold (int): Threshold for stoichiometry limit, default = 8.
+        processes (int): Number of worker processes; defaults to the
+            number of CPUs.  With 1, the space is counted in this process.
+        chunksize (int): Number of element combinations sent to a worker
+            at a time.
+        oxidation_states_set (str): Name of the oxidation-state set, see
+            :func:`smact.data_loader.oxidation_state_sets`.
+        mode (str): What to combine, 'elements' (one oxidation state per
+            element) or 'species' (see above).
+
+    Returns:
+        dict: For each order, a dict with keys
+
+        neutral
+            *Counter* of charge-neutral stoichiometries
+        electronegativity
+            *Counter* of those which also pass the electronegativity test
+
+        keyed by the symbol of the anion (the most electronegative
+        element in a negative oxidation state, or None if there is
+        none), e.g. ``sum(counts[3]['electronegativity'].values())`` is
+        the number of ternary stoichiometries passing both tests.
+    """
+    import numpy as np
+    from smact import parallel
+    if mode not in ('elements', 'species'):
+        raise ValueError("Unknown counting mode {0}".format(mode))
+    species = mode == 'species'
+    symbols = [e if isinstance(e, str) else e.symbol for e in elements]
+    orders = [orders] if isinstance(orders, int) else list(orders)
+
+    tables = parallel.element_tables(
+        symbols, max_n=1, threshold=threshold,
+        oxidation_states_set=oxidation_states_set)
+    for order in orders:
+        tables['neutral_counts_{0}'.format(order)] = \
+            parallel.neutral_stoichiometry_counts(
+                tables['oxidation_states'].tolist(), order,
+                threshold=threshold)
+
+    def element_sets(order):
+        sizes = range(2, order + 1) if species else [order]
+        return itertools.chain.from_iterable(
+            itertools.combinations(range(len(symbols)), size)
+            for size in sizes)
+
+    tasks = ((order, chunk, species) for order in orders
+             for chunk in _chunks(element_sets(order), chunksize))
+    totals = {order: np.zeros((2, len(symbols) + 1), dtype=np.int64)
+              for order in orders}
+
+    if processes == 1:
+        for order, counts in (_count_combinations(tables, *task)
+                              for task in tasks):
+            totals[order] += counts
+    else:
+        with parallel.SharedArrays(tables) as shared:
+            for order, counts in _bounded_imap(
+                    _count_chunk, tasks, processes,
+                    initializer=parallel.init_worker,
+                    initargs=(shared.spec,)):
+                totals[order] += counts
+
+    anions = symbols + [None]
+    return {order: {stage: Counter({anion: int(count) for anion, count
+                                    in zip(anions, row) if count})
+                    for stage, row in zip(('neutral', 'electronegativity'),
+                                          counts)}
+            for order, counts in totals.items()}
@@ -1,12 +1,28 @@
 #!/usr/bin/env python
 
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
+import numpy as np
 import smact
 from smact.properties import compound_electroneg
 from smact.builder import wurtzite
 import smact.screening
 import smact.lattice
 
+# Budget for `import smact` in a fresh interpreter with compiled bytecode,
+# as a multiple of the start-up time of a bare interpreter measured in the
+# same run, so that it scales with the speed and load of the machine.  The
+# import takes about 3 times as long; importing NumPy as well, about 10.
+# Timings are unreliable on shared machines, so the test only runs when
+# SMACT_TEST_IMPORT_TIME is set.
+IMPORT_TIME_FACTOR = float(os.environ.get('SMACT_IMPORT_TIME_FACTOR', 6))
+
 
 class TestSequenceFunctions(unittest.TestCase):
 
@@ -21,6 +37,85 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertEqual(Pt.ionpot, 8.95883)
         self.assertEqual(Pt.number, 78)
 
+    def test_Element_interned(self):
+        Fe = smact.Element('Fe')
+        self.assertIs(Fe, smact.Element('Fe'))
+        self.assertIs(Fe, pickle.loads(pickle.dumps(Fe)))
+        self.assertFalse(hasattr(Fe, '__dict__'))
+        with self.assertRaises(AttributeError):
+            Fe.pauling_eneg = 0.
+        Fe3 = smact.Species('Fe', 3, '6_n')
+        self.assertIs(Fe3, smact.Species('Fe', 3, coordination='6_n'))
+        self.assertIs(Fe3, pickle.loads(pickle.dumps(Fe3)))
+        self.assertEqual(Fe3.shannon_radius, 0.74)
+        self.assertEqual(Fe3.SSE_2015, -4.71)
+        self.assertIsNot(Fe3, smact.Species('Fe', 2, '6_n'))
+        with self.assertRaises(NameError):
+            smact.Element('Xx')
+        # Shared objects hand out copies of their lists
+        Fe.oxidation_states.append(99)
+        self.assertNotIn(99, smact.Element('Fe').oxidation_states)
+
+    def test_Element_lazy_attributes(self):
+        # Run in a fresh interpreter so no other test has loaded the data,
+        # recording every file opened (source tables or their cache files)
+        script = ("import builtins, os; opened = []; _open = builtins.open\n"
+                  "def recording_open(file, *args, **kwargs):\n"
+                  "    opened.append(os.path.basename(str(file)))\n"
+                  "    return _open(file, *args, **kwargs)\n"
+                  "builtins.open = recording_open\n"
+                  "import smact; smact.Element('Fe').pauling_eneg\n"
+                  "print(sorted({name.split('-')[0] for name in opened}))")
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.strip(), b"['element_data.txt']")
+        Zn = smact.Element('Zn')
+        self.assertEqual(Zn.SSE, -4.0)
+        self.assertEqual(Zn.oxidation_states, [1, 2])
+        self.assertIn('4_n', Zn.coord_envs)
+
+    def test_species_table(self):
+        radii, sse_2015 = smact.species_table(
+            [('Fe', 3, '6_n'), ('O', -2, '4_n'), ('Fe', 3, '12_n')])
+        self.assertEqual(radii[:2].tolist(), [0.74, 1.24])
+        self.assertTrue(np.isnan(radii[2]))
+        self.assertEqual(sse_2015.tolist(), [-4.71, -7.98, -4.71])
+
+    def test_import_is_light(self):
+        # Optional heavy dependencies must only load when actually used
+        script = ("import sys, smact, smact.screening, smact.properties, "
+                  "smact.oxidationstates; "
+                  "print(sorted(m for m in ('pymatgen', 'matplotlib', 'tqdm', "
+                  "'past', 'future') if m in sys.modules))")
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.strip(), b'[]')
+        # Nor is NumPy needed to import the screening and property modules
+        script = ("import sys, smact, smact.screening, smact.properties; "
+                  "print(sorted(m for m in ('numpy', 'multiprocessing', "
+                  "'smact.parallel') if m in sys.modules))")
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.strip(), b'[]')
+        from smact import oxidationstates
+        self.assertIn(('Fe', 3.0), oxidationstates.species_list)
+
+    @unittest.skipUnless(os.environ.get('SMACT_TEST_IMPORT_TIME'),
+                         "timing test; set SMACT_TEST_IMPORT_TIME=1 to run")
+    def test_import_time_budget(self):
+        def run_time(code, env):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], env=env,
+                           check=True)
+            return time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # Time imports from compiled bytecode, as in an installation
+            env = dict(os.environ, PYTHONPYCACHEPREFIX=tmp)
+            env.pop('PYTHONDONTWRITEBYTECODE', None)
+            run_time('import smact', env)
+            startup = min(run_time('pass', env) for _ in range(5))
+            seconds = min(run_time('import smact', env)
+                          for _ in range(5)) - startup
+        self.assertLess(seconds, IMPORT_TIME_FACTOR * startup)
+
     def test_ordered_elements(self):
         self.assertEqual(
             smact.ordered_elements(65, 68),
@@ -29,6 +124,224 @@ class TestSequenceFunctions(unittest.TestCase):
             smact.ordered_elements(52, 52),
             ['Te'])
 
+    def test_periodic_index(self):
+        from smact import data_loader
+        self.assertEqual(data_loader.lookup_atomic_number('Te'), 52)
+        self.assertEqual(data_loader.lookup_element_symbol(52), 'Te')
+        self.assertIsNone(data_loader.lookup_atomic_number('Xx'))
+        self.assertIsNone(data_loader.lookup_element_symbol(0))
+
+    def test_data_cache(self):
+        import shutil
+        from smact import data_loader
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = os.path.join(tmp, 'cache')
+            source = os.path.join(tmp, 'oxidation_states.txt')
+            shutil.copy(os.path.join(smact.data_directory,
+                                     'oxidation_states.txt'), source)
+            sources = {'oxidation_states.txt': source}
+            store = data_loader.DataStore(sources=sources, cache_dir=cache)
+            states = store.lookup_element_oxidation_states('Fe')
+            # Only the table used is cached
+            self.assertEqual(len(os.listdir(cache)), 1)
+
+            def loaded_from(store):
+                store.lookup_element_oxidation_states('Fe')
+                return store.stats()['tables']['oxidation_states.txt'][
+                    'source']
+
+            cached = data_loader.DataStore(sources=sources, cache_dir=cache)
+            self.assertEqual(os.path.dirname(loaded_from(cached)), cache)
+            self.assertEqual(cached.lookup_element_oxidation_states('Fe'),
+                             states)
+            # A source file touched without changing is still cached...
+            status = os.stat(source)
+            os.utime(source, ns=(0, 0))
+            self.assertEqual(os.path.dirname(loaded_from(data_loader.DataStore(
+                sources=sources, cache_dir=cache))), cache)
+            # ...but one edited keeping its size and time is out of date
+            with open(source) as file:
+                text = file.read()
+            with open(source, 'w') as file:
+                file.write(text.replace('\nFe -2 ', '\nFe -3 ', 1))
+            os.utime(source, ns=(status.st_atime_ns, status.st_mtime_ns))
+            edited = data_loader.DataStore(sources=sources, cache_dir=cache)
+            self.assertEqual(loaded_from(edited), source)
+            self.assertEqual(
+                edited.lookup_element_oxidation_states('Fe')[0], -3)
+            tables = store.build_cache()
+            self.assertEqual(len(os.listdir(cache)), len(tables))
+            # Cached tables are JSON, read back as the parsed records
+            path = data_loader._cache_file(
+                cache, 'shannon_radii.csv',
+                os.path.join(smact.data_directory, 'shannon_radii.csv'))
+            with open(path) as file:
+                self.assertEqual(json.load(file)['version'],
+                                 data_loader._CACHE_VERSION)
+            shannon = data_loader.DataStore(cache_dir=cache)
+            radius = shannon.lookup_element_shannon_radius_data('Fe')[0]
+            self.assertEqual(os.path.dirname(shannon.stats()['tables'][
+                'shannon_radii.csv']['source']), cache)
+            self.assertIsInstance(radius, data_loader.ShannonRadiusRecord)
+            self.assertEqual(radius, data_loader.DataStore()
+                             .lookup_element_shannon_radius_data('Fe')[0])
+        # Caching is opt-in: by default nothing is written to the user's
+        # cache directory
+        with tempfile.TemporaryDirectory() as tmp:
+            subprocess.check_call(
+                [sys.executable, '-c',
+                 "import smact; smact.Element('Fe').oxidation_states"],
+                env=dict(os.environ, XDG_CACHE_HOME=tmp))
+            self.assertEqual(os.listdir(tmp), [])
+            self.assertIsNone(data_loader.get_default_store().cache_dir)
+            data_loader.set_cache(path=tmp)
+            try:
+                data_loader.lookup_element_oxidation_states('Fe')
+                self.assertEqual(len(os.listdir(tmp)), 1)
+            finally:
+                data_loader.set_cache(False)
+        # An unwritable cache falls back to parsing just the table used
+        events = []
+        data_loader.add_event_hook(events.append)
+        try:
+            store = data_loader.DataStore(cache_dir='/proc/nope')
+            self.assertEqual(store.lookup_element_data('Fe')['Name'], 'Iron')
+        finally:
+            data_loader.remove_event_hook(events.append)
+        self.assertEqual([event['event'] for event in events],
+                         ['cache_write_failed', 'table_loaded'])
+        self.assertEqual(list(store.stats()['tables']), ['element_data.txt'])
+
+    def test_data_store(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from smact import data_loader
+        store = data_loader.DataStore()
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(
+                lambda _: store.lookup_element_data('Fe'),
+                range(32)))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(results[0]['Name'], 'Iron')
+        icsd = data_loader.DataStore(sources={
+            'oxidation_states.txt': os.path.join(
+                smact.data_directory, 'oxidation_states_icsd.txt')})
+        self.assertEqual(icsd.lookup_element_oxidation_states('Fe'),
+                         data_loader.lookup_element_oxidation_states_icsd('Fe'))
+        self.assertFalse(store.is_loaded('oxidation_states.txt'))
+        with self.assertRaises(ValueError):
+            data_loader.DataStore(sources={'missing.txt': 'missing.txt'})
+
+    def test_data_loader_stats(self):
+        from smact import data_loader
+        events = []
+        data_loader.add_event_hook(events.append)
+        try:
+            store = data_loader.DataStore()
+            store.lookup_element_data('Fe')
+            store.lookup_element_data('Xx')
+        finally:
+            data_loader.remove_event_hook(events.append)
+        stats = store.stats()
+        self.assertEqual(stats['lookups']['lookup_element_data'],
+                         {'calls': 2, 'hits': 1, 'missing': 1})
+        self.assertEqual(stats['tables']['element_data.txt']['rows'], 103)
+        self.assertGreater(stats['tables']['element_data.txt']['bytes'], 0)
+        self.assertEqual([(event['event'], event.get('key'))
+                          for event in events],
+                         [('table_loaded', None), ('missing_data', 'Xx')])
+        self.assertIn('lookups', data_loader.stats())
+
+    def test_lookup_many(self):
+        from smact import data_loader
+        eneg = data_loader.lookup_many('pauling_eneg', ['Fe', 'Xx', 'O'])
+        self.assertEqual(eneg[[0, 2]].tolist(), [1.83, 3.44])
+        self.assertTrue(np.isnan(eneg[1]))
+        self.assertEqual(
+            data_loader.lookup_many('HHI_p', [26]).tolist(),
+            [smact.Element('Fe').HHI_p])
+        offsets, values = data_loader.lookup_oxidation_states_many(
+            ['O', 'Xx', 'Rb'])
+        self.assertEqual(offsets.tolist(), [0, 4, 4, 6])
+        self.assertEqual(values[offsets[2]:].tolist(), [-1, 1])
+        with self.assertRaises(ValueError):
+            data_loader.lookup_many('name', ['Fe'])
+
+    def test_shannon_radii_query(self):
+        from smact import data_loader
+        radii = data_loader.lookup_shannon_radii_many(
+            elements=['Fe', 'Co', 'Xx'], charges=[3],
+            coordinations=['6_n'])
+        self.assertEqual(radii['symbol'].tolist(), ['Co', 'Fe'])
+        self.assertEqual(radii['ionic_radius'][-1], 0.6)
+        octahedral = data_loader.lookup_shannon_radii_many(
+            coordinations=['6_n'])
+        self.assertTrue((octahedral['coordination_number'] == 6).all())
+        self.assertIsNone(data_loader.lookup_species_shannon_radius_data(
+            'Fe', 3, '7_n'))
+        self.assertEqual(data_loader.lookup_species_shannon_radius_data(
+            'Fe', 3, '7_n', nearest=True).coordination, '6_n')
+        self.assertEqual(data_loader.lookup_species_shannon_radius_data(
+            'Fe', 2, '5_n', nearest=True).coordination, '4_n')
+        self.assertIsNone(data_loader.lookup_species_shannon_radius_data(
+            'Fe', 5, '6_n', nearest=True))
+
+    def test_data_overlay(self):
+        from smact import data_loader
+        Fe, O = smact.Element('Fe'), smact.Element('O')
+        before = smact.screening.neutral_combinations(('Fe', 'O'))
+        try:
+            data_loader.add_overlay('element_data.txt',
+                                    {'Fe': {'el_neg': 1.9}})
+            data_loader.add_overlay('oxidation_states.txt', {'Fe': (3,)})
+            self.assertEqual(data_loader.overlays(),
+                             {'element_data.txt': ['Fe'],
+                              'oxidation_states.txt': ['Fe']})
+            self.assertIsNot(smact.Element('Fe'), Fe)
+            self.assertIs(smact.Element('O'), O)
+            self.assertEqual(smact.Element('Fe').pauling_eneg, 1.9)
+            self.assertEqual(smact.Element('Fe').oxidation_states, [3])
+            self.assertEqual(
+                data_loader.lookup_many('pauling_eneg', ['Fe', 'O']).tolist(),
+                [1.9, 3.44])
+            self.assertCountEqual(smact.screening.smact_test(['Fe', 'O']),
+                                  [[['Fe', 'O'], (2, 3)],
+                                   [['Fe', 'O'], (1, 3)]])
+            with self.assertRaises(ValueError):
+                data_loader.add_overlay('element_data.txt',
+                                        {'Fe': {'electronegativity': 1.9}})
+        finally:
+            data_loader.remove_overlay('element_data.txt')
+            data_loader.remove_overlay('oxidation_states.txt')
+        self.assertEqual(smact.Element('Fe').pauling_eneg, 1.83)
+        self.assertEqual(smact.screening.neutral_combinations(('Fe', 'O')),
+                         before)
+
+    def test_data_records(self):
+        from smact import data_loader
+        Fe = data_loader.lookup_element_data('Fe')
+        self.assertIs(Fe, data_loader.lookup_element_data('Fe'))
+        self.assertEqual(Fe['Name'], Fe.Name)
+        with self.assertRaises(TypeError):
+            Fe[1] = 'Rust'
+        self.assertEqual(dict(Fe.items()), Fe._asdict())
+        self.assertEqual(list(Fe.keys()), list(Fe._asdict()))
+        self.assertEqual(Fe.values(), tuple(Fe[i] for i in range(len(Fe))))
+        # As a read-only dict
+        self.assertEqual(list(Fe), list(Fe.keys()))
+        self.assertIn('Name', Fe)
+        self.assertNotIn('Iron', Fe)
+        self.assertEqual(Fe, Fe._asdict())
+        self.assertEqual(pickle.loads(pickle.dumps(Fe)), Fe)
+        self.assertEqual(Fe._replace(Name='Rust')['Name'], 'Rust')
+        rust = Fe.copy()
+        rust['Name'] = 'Rust'
+        self.assertEqual(Fe['Name'], 'Iron')
+        radii = data_loader.lookup_element_shannon_radius_data('Fe')
+        self.assertIsInstance(radii, tuple)
+        self.assertEqual(radii[0]['coordination'], radii[0].coordination)
+        self.assertEqual(
+            data_loader.lookup_element_oxidation_states('Rb'), (-1, 1))
+
     def test_element_dictionary(self):
         newlist = ['O', 'Rb', 'W']
         dictionary = smact.element_dictionary(newlist)
@@ -37,6 +350,15 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertEqual(dictionary['W'].name, 'Tungsten')
         self.assertTrue('Rn' in smact.element_dictionary())
 
+    def test_element_table(self):
+        table = smact.ElementTable()
+        z = table.numbers(['Pt', 'O', 'Rb'])
+        self.assertEqual(z.tolist(), [78, 8, 37])
+        self.assertEqual(table.symbols[78], 'Pt')
+        self.assertEqual(table.ionpot[z][0], smact.Element('Pt').ionpot)
+        self.assertEqual(table.oxidation_states(37).tolist(), [-1, 1])
+        self.assertTrue(np.isnan(table.SSE[78]))
+
     def test_are_eq(self):
         self.assertTrue(
             smact.are_eq([1.00, 2.00, 3.00],
@@ -67,6 +389,80 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertEqual(len(neutral_combos), 9)
         self.assertTrue((3, 2, 1) in neutral_combos)
 
+    def test_neutral_ratios_numpy(self):
+        for ox, threshold in (([1, -2, 1], 5), ([3, -2], 8),
+                              ([2, 4, -2, -1], 4), ([1, 1], 3)):
+            self.assertEqual(
+                smact.neutral_ratios(ox, threshold=threshold),
+                smact.neutral_ratios(ox, threshold=threshold,
+                                     method='python'))
+        stoichs = [[1, 2], [1, 2, 3], [2, 4]]
+        self.assertEqual(
+            smact.neutral_ratios([3, -2, 1], stoichs=stoichs),
+            smact.neutral_ratios([3, -2, 1], stoichs=stoichs,
+                                 method='python'))
+        exists, ratios = smact.neutral_ratios([3, -2], as_array=True)
+        self.assertTrue(exists)
+        self.assertEqual(ratios.tolist(), [[2, 3]])
+        # Fractional states are never truncated
+        for method in ('numpy', 'mitm', 'python'):
+            self.assertEqual(smact.neutral_ratios([1.5, -1], method=method),
+                             (True, [(2, 3)]))
+        self.assertEqual(smact.neutral_ratios([2.0, -1]), (True, [(1, 2)]))
+        with self.assertRaises(ValueError):
+            smact.neutral_ratios_array([1.5, -1])
+
+    def test_neutral_ratios_mitm(self):
+        for ox, threshold in (([1, -2, 1], 5), ([2, 3, -2, -1, 1], 4),
+                              ([1, 2, 3, -1, -2, -3], 3), ([3, -2], 8)):
+            self.assertEqual(
+                smact.neutral_ratios(ox, threshold=threshold, method='mitm'),
+                smact.neutral_ratios(ox, threshold=threshold,
+                                     method='python'))
+        stoichs = [[1, 2], [1, 2, 3], [2, 4], [1, 5]]
+        self.assertEqual(
+            smact.neutral_ratios([3, -2, 1, -1], stoichs=stoichs,
+                                 method='mitm'),
+            smact.neutral_ratios([3, -2, 1, -1], stoichs=stoichs,
+                                 method='python'))
+
+    def test_neutral_ratios_memo(self):
+        smact.neutral_ratios_cache_clear()
+        for ox in ((2, -2, 1), (1, 2, -2), (-2, 1, 2)):
+            self.assertEqual(
+                smact.neutral_ratios(ox, threshold=6),
+                smact.neutral_ratios(ox, threshold=6, method='python'))
+        info = smact.neutral_ratios_cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_irreducible_ratios_cache(self):
+        smact._irreducible_ratios_cache.clear()
+        grid = smact._irreducible_ratios(3, 4)
+        self.assertIs(grid, smact._irreducible_ratios(3, 4))
+        self.assertFalse(grid.flags.writeable)
+        self.assertTrue(all(smact._gcd_recursive(*row) == 1
+                            for row in grid.tolist()))
+        # The cache is bounded by the memory its grids take
+        limit = smact._IRREDUCIBLE_RATIOS_MAX_BYTES
+        self.addCleanup(setattr, smact, '_IRREDUCIBLE_RATIOS_MAX_BYTES',
+                        limit)
+        smact._IRREDUCIBLE_RATIOS_MAX_BYTES = grid.nbytes
+        smact._irreducible_ratios(2, 4)
+        self.assertEqual(list(smact._irreducible_ratios_cache), [(2, 4)])
+        smact._IRREDUCIBLE_RATIOS_MAX_BYTES = 0
+        self.assertIsNot(smact._irreducible_ratios(3, 4), grid)
+        self.assertNotIn((3, 4), smact._irreducible_ratios_cache)
+
+    def test_neutral_ratios_auto(self):
+        smact.neutral_ratios_cache_clear()
+        ox = (2, 3, -2, -1, 1)
+        self.assertEqual(smact.neutral_ratios(ox, threshold=4),
+                         smact.neutral_ratios(ox, threshold=4,
+                                              method='python'))
+        # Five sites are searched with 'mitm', memoized under its name
+        smact.neutral_ratios(ox, threshold=4, method='mitm')
+        self.assertEqual(smact.neutral_ratios_cache_info().hits, 1)
+
     def test_pauling_test(self):
         Sn, S = (smact.Element(label) for label in ('Sn', 'S'))
         self.assertTrue(smact.screening.pauling_test(
@@ -92,6 +488,203 @@ class TestSequenceFunctions(unittest.TestCase):
             symbols=('S', 'Sn', 'Sn'), repeat_anions=False
             ))
 
+    def test_eneg_states_mask(self):
+        ox_states = [(2, -2, 0), (-2, 2, 0), (2, 2, -2), (1, -1, -2)]
+        enegs = [(1.96, 2.58, 3.44), (1.96, 2.58, 3.44),
+                 (1.96, 2.58, 2.58), (0.98, 3.98, None)]
+        for threshold in (0., 0.5):
+            self.assertEqual(
+                smact.screening.eneg_states_mask(
+                    ox_states, enegs, threshold=threshold).tolist(),
+                [smact.screening.pauling_test(ox, eneg, threshold=threshold)
+                 for ox, eneg in zip(ox_states[:3], enegs[:3])]
+                + [threshold != 0.])
+        self.assertEqual(smact.screening.eneg_states_mask(
+            [(2, -2), (-2, 2)], (1.96, 2.58)).tolist(), [True, False])
+        # Missing values are treated as in eneg_states_test, where a NaN
+        # never fails and a None always does without a threshold
+        ox_states = [(2, -1, 0), (0, 1, -1), (2, -1, 0), (1, -1, -2)]
+        enegs = [(np.nan, 2.0, 1.0), (None, 1.0, 2.0),
+                 (np.nan, 2.0, None), (2.0, np.nan, 1.0)]
+        self.assertEqual(smact.screening.eneg_states_mask(
+            ox_states, np.array(enegs, dtype=object)).tolist(),
+            [smact.screening.eneg_states_test(ox, eneg)
+             for ox, eneg in zip(ox_states, enegs)])
+        self.assertEqual(smact.screening.eneg_states_mask(
+            ox_states, np.array(enegs, dtype=object), threshold=0.5).tolist(),
+            [True, True, True, False])
+
+    def test_oxidation_state_products(self):
+        import itertools
+        ox_combos = [(1, 2, 3), (-1, 4), (-4, -2, 1)]
+        products = list(smact.screening.oxidation_state_products(
+            ox_combos, threshold=2))
+        self.assertEqual(products, [
+            ox_states for ox_states in itertools.product(*ox_combos)
+            if ox_states in products])
+        self.assertEqual(
+            [ox_states for ox_states in products
+             if smact.neutral_ratios(ox_states, threshold=2)[0]],
+            [ox_states for ox_states in itertools.product(*ox_combos)
+             if smact.neutral_ratios(ox_states, threshold=2)[0]])
+        self.assertNotIn((1, 4, 1), products)
+        self.assertNotIn((1, -1, -4), products)
+        self.assertEqual(list(smact.screening.oxidation_state_products(
+            [(1,), (-4,)], threshold=2)), [])
+
+    def test_smact_test_iter(self):
+        compositions = smact.screening.smact_test_iter(
+            ['Cu', 'Zn', 'S'], threshold=4, chunksize=5)
+        symbols, ratio = next(compositions)
+        self.assertEqual(symbols, ['Cu', 'Zn', 'S'])
+        ratios = [ratio] + [ratio for symbols, ratio in compositions]
+        self.assertEqual(len(ratios), len(set(ratios)))
+        self.assertCountEqual(
+            ratios, [ratio for symbols, ratio in smact.screening.smact_test(
+                ['Cu', 'Zn', 'S'], threshold=4)])
+
+    def test_screen_space(self):
+        import itertools
+        elements = ['Li', 'Na', 'Cu', 'Zn', 'S']
+        expected = [composition
+                    for els in itertools.combinations(elements, 2)
+                    for composition in smact.screening.smact_test(
+                        els, threshold=3, include=['O'])]
+        for processes in (1, 2):
+            self.assertEqual(list(smact.screening.screen_space(
+                elements, 2, threshold=3, include=[smact.Element('O')],
+                processes=processes, chunksize=3)), expected)
+
+    def test_count_space(self):
+        import itertools
+        from collections import Counter
+        elements = ['Li', 'Cu', 'Zn', 'S', 'O', 'Cl']
+        expected = {'neutral': Counter(), 'electronegativity': Counter()}
+        for els in itertools.combinations(elements, 3):
+            enegs = [smact.Element(el).pauling_eneg for el in els]
+            for ox_states in itertools.product(
+                    *(smact.Element(el).oxidation_states for el in els)):
+                n = len(smact.neutral_ratios(ox_states, threshold=4)[1])
+                anions = [(eneg, el) for el, eneg, ox in
+                          zip(els, enegs, ox_states) if ox < 0]
+                anion = max(anions)[1] if anions else None
+                expected['neutral'][anion] += n
+                if smact.screening.pauling_test(ox_states, enegs):
+                    expected['electronegativity'][anion] += n
+        expected = {stage: +counts for stage, counts in expected.items()}
+        for processes in (1, 2):
+            counts = smact.screening.count_space(
+                elements, [3], threshold=4, processes=processes,
+                chunksize=4)
+            self.assertEqual(counts, {3: expected})
+
+    def test_count_space_species(self):
+        import itertools
+        elements = ['Li', 'Fe', 'Cu', 'S', 'O']
+        # The count of examples/Counting/ElementCombinationsParallel.py
+        expected = {'neutral': 0, 'electronegativity': 0}
+        for size in (2, 3):
+            for els in itertools.combinations(elements, size):
+                species = [(ox, smact.Element(el).pauling_eneg)
+                           for el in els
+                           for ox in smact.Element(el).oxidation_states]
+                for combination in itertools.combinations(species, 3):
+                    ox_states, enegs = zip(*combination)
+                    n = len(smact.neutral_ratios(ox_states,
+                                                 threshold=4)[1])
+                    expected['neutral'] += n
+                    if n and smact.screening.eneg_states_test(ox_states,
+                                                              enegs):
+                        expected['electronegativity'] += n
+        for processes in (1, 2):
+            counts = smact.screening.count_space(
+                elements, 3, threshold=4, processes=processes,
+                chunksize=4, mode='species')[3]
+            self.assertEqual({stage: sum(counts[stage].values())
+                              for stage in counts}, expected)
+        with self.assertRaises(ValueError):
+            smact.screening.count_space(elements, 3, mode='ions')
+
+    def test_ml_rep_batch(self):
+        Li2O = smact.screening.ml_rep_generator(['Li', 'O'], [2, 1])
+        self.assertEqual(len(Li2O), 103)
+        self.assertEqual((Li2O[2], Li2O[7]), (2 / 3, 1 / 3))
+        compositions = [(('Li', 'O'), (2, 1)),
+                        ([smact.Element('Lr'), smact.Element('Fe')], None),
+                        (('Fe', 'O', 'Fe'), (1, 1, 2))]
+        dense = smact.screening.ml_rep_batch(compositions)
+        self.assertEqual(dense.dtype, np.float32)
+        np.testing.assert_allclose(dense[0], Li2O)
+        np.testing.assert_allclose(dense[2], smact.screening.ml_rep_generator(
+            ['Fe', 'O'], [3, 1]))
+        sparse = smact.screening.ml_rep_batch(compositions, sparse=True)
+        np.testing.assert_array_equal(sparse.toarray(), dense)
+        self.assertEqual(sparse.nnz, 6)
+        chunks = list(smact.screening.ml_rep_chunks(iter(compositions),
+                                                    chunksize=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        np.testing.assert_array_equal(np.vstack(chunks), dense)
+        with self.assertRaises(NameError):
+            smact.screening.ml_rep_batch([(('Fe', 'Xx'), None)])
+        # Elements beyond Lr are in the periodic table but not the vector
+        for sparse in (False, True):
+            with self.assertRaises(NameError):
+                smact.screening.ml_rep_batch([(('O', 'Rf'), None)],
+                                             sparse=sparse)
+
+    def test_shared_tables(self):
+        from multiprocessing import Pool
+        from smact import parallel
+        tables = parallel.element_tables(['Cu', 'Zn', 'S', 'O'], max_n=3,
+                                         threshold=4)
+        states = tables['oxidation_states'].tolist()
+        counts = tables['neutral_counts_3']
+        i, j, k = (states.index(state) for state in (-2, 1, 2))
+        self.assertEqual(counts[i, j, k], len(smact.neutral_ratios(
+            (-2, 1, 2), threshold=4)[1]))
+        with parallel.SharedArrays(tables) as shared:
+            with Pool(1, initializer=parallel.init_worker,
+                      initargs=(shared.spec,)) as pool:
+                worker_tables = pool.apply(parallel.worker_arrays)
+            # Re-initialising a worker releases the blocks it attached
+            parallel.init_worker(shared.spec)
+            parallel.init_worker(shared.spec)
+            self.assertEqual(len(parallel._attached_blocks), len(tables))
+            eneg = parallel.attach_arrays(
+                {'pauling_eneg': shared.spec['pauling_eneg']})['pauling_eneg']
+            self.assertEqual(parallel.detach_arrays(), 1)
+            self.assertIsNone(parallel.worker_arrays())
+            del eneg
+            self.assertEqual(parallel.detach_arrays(), 0)
+        for name, array in tables.items():
+            np.testing.assert_array_equal(worker_tables[name], array)
+
+    def test_oxidation_state_sets(self):
+        from smact import data_loader
+        self.assertEqual(data_loader.oxidation_state_sets(),
+                         ['default', 'icsd', 'pmg', 'sp'])
+        self.assertEqual(data_loader.lookup_oxidation_state_set('O', 'icsd'),
+                         data_loader.lookup_element_oxidation_states_icsd('O'))
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'states.txt')
+            with open(filename, 'w') as file:
+                file.write('Fe 3\nO -2\n')
+            data_loader.register_oxidation_state_set('test', filename)
+            self.addCleanup(data_loader.unregister_oxidation_state_set,
+                            'test')
+            compositions = smact.screening.smact_test(
+                ['Fe', 'O'], threshold=4, oxidation_states_set='test')
+        self.assertEqual(compositions, [[['Fe', 'O'], (2, 3)]])
+        self.assertGreater(len(smact.screening.smact_test(['Fe', 'O'])), 1)
+        with self.assertRaises(ValueError):
+            smact.screening.smact_test(['Fe', 'O'],
+                                       oxidation_states_set='missing')
+        with self.assertRaises(ValueError):
+            data_loader.unregister_oxidation_state_set('default')
+        with self.assertRaises(ValueError):
+            data_loader.register_oxidation_state_set('icsd', filename)
+        self.assertIn('icsd', data_loader.oxidation_state_sets())
+
     # ---------------- Properties ----------------
 
     def test_compound_eneg_brass(self):